@@ -2,11 +2,82 @@
 Async client implementation for the Anthropic-OpenAI bridge.
 """
 
-from typing import Optional
+import asyncio
+import weakref
+from typing import AsyncGenerator, Optional, Tuple
 
 import httpx
 
 from .async_messages import AsyncMessages
+from .utils import DEFAULT_CONNECTION_LIMITS, HTTP2_AVAILABLE, AsyncRetryTransport
+
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_MAX_RETRIES = 2
+
+# Pools shared by default-configured clients, one per event loop since httpx
+# connections cannot move between loops. Each pool is paired with the
+# generator that closes it when its loop shuts down; entries go away with
+# their loop.
+_Shared = Tuple[httpx.AsyncClient, AsyncGenerator[None, None]]
+_shared_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Shared]"
+_shared_http_clients = weakref.WeakKeyDictionary()
+
+
+def _build_transport(
+    limits: httpx.Limits, max_retries: int
+) -> httpx.AsyncBaseTransport:
+    # Pool limits belong on the transport once one is passed to the client.
+    # max_retries applies twice: httpx retries failed connection attempts,
+    # AsyncRetryTransport retries 429/502/503/504 responses.
+    transport = httpx.AsyncHTTPTransport(
+        retries=max_retries, limits=limits, http2=HTTP2_AVAILABLE
+    )
+    if max_retries > 0:
+        return AsyncRetryTransport(transport, max_retries=max_retries)
+    return transport
+
+
+async def _close_on_loop_shutdown(
+    http_client: httpx.AsyncClient,
+) -> AsyncGenerator[None, None]:
+    """Close ``http_client`` once its event loop shuts down.
+
+    asyncio.run() and other runners call loop.shutdown_asyncgens() before
+    closing the loop, which finalises this generator while the loop can
+    still close the pool's connections.
+    """
+    try:
+        yield
+    finally:
+        await http_client.aclose()
+
+
+def _get_shared_http_client() -> Optional[httpx.AsyncClient]:
+    """Return the pooled client for the running event loop, if there is one."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    shared = _shared_http_clients.get(loop)
+    if shared is not None and not shared[0].is_closed:
+        return shared[0]
+
+    # Authorization is sent per request by AsyncMessages, so the shared
+    # client carries no credentials of its own.
+    http_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(DEFAULT_TIMEOUT),
+        transport=_build_transport(DEFAULT_CONNECTION_LIMITS, DEFAULT_MAX_RETRIES),
+    )
+    # Step the generator to its yield without awaiting; starting it also
+    # registers it with the running loop's async generator hooks.
+    closer = _close_on_loop_shutdown(http_client)
+    try:
+        closer.__anext__().send(None)
+    except StopIteration:
+        pass
+    _shared_http_clients[loop] = (http_client, closer)
+    return http_client
 
 
 class AsyncAnthropicClient:
@@ -16,14 +87,38 @@ class AsyncAnthropicClient:
         self,
         api_key: str,
         base_url: str = "https://api.openai.com/v1",
-        timeout: float = 60.0,
-        max_retries: int = 2,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
         http_client: Optional[httpx.AsyncClient] = None,
+        limits: Optional[httpx.Limits] = None,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
+
+        # Only clients we did not take from the shared pool are closed on exit
+        self._owns_http_client = True
+        if (
+            http_client is None
+            and limits is None
+            and timeout == DEFAULT_TIMEOUT
+            and max_retries == DEFAULT_MAX_RETRIES
+        ):
+            # Reuse keep-alive connections across every default-configured
+            # client created on the same event loop.
+            http_client = _get_shared_http_client()
+            self._owns_http_client = http_client is None
+        if http_client is None:
+            # Build one pooled client up front so every request made through
+            # this instance reuses the same keep-alive connections.
+            http_client = httpx.AsyncClient(
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=httpx.Timeout(timeout),
+                transport=_build_transport(
+                    limits or DEFAULT_CONNECTION_LIMITS, max_retries
+                ),
+            )
         self._http_client = http_client
         self._messages: Optional[AsyncMessages] = None
 
@@ -42,5 +137,5 @@ class AsyncAnthropicClient:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self._http_client:
+        if self._http_client and self._owns_http_client:
             await self._http_client.aclose()
@@ -4,6 +4,7 @@ from typing import Optional
 import httpx
 
 from .messages import Messages
+from .utils import DEFAULT_CONNECTION_LIMITS, HTTP2_AVAILABLE, RetryTransport
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,7 @@ class AnthropicClient:
         max_retries: int = 2,
         default_headers: Optional[dict] = None,
         http_client: Optional[httpx.Client] = None,
+        limits: Optional[httpx.Limits] = None,
         **kwargs,
     ):
         """
@@ -52,9 +54,15 @@ class AnthropicClient:
             api_key: OpenAI API key for authentication.
             base_url: Base URL for the OpenAI-compatible service.
             timeout: Request timeout in seconds.
-            max_retries: Maximum number of request retries.
+            max_retries: Maximum number of request retries. Applied twice:
+                httpx retries failed connection attempts up to this many
+                times, and 429/502/503/504 responses are separately retried
+                up to this many times with backoff. 500s are not retried.
             default_headers: Additional headers to include in requests.
             http_client: Custom httpx.Client instance (optional).
+            limits: Connection pool limits for the built-in HTTP client
+                (ignored when http_client is given). Defaults to 1000
+                connections with 100 kept alive for 30 seconds.
             **kwargs: Additional keyword arguments (ignored).
         """
         self.api_key = api_key
@@ -63,13 +71,29 @@ class AnthropicClient:
         if http_client is None:
             headers = default_headers or {}
             headers.update({"Authorization": f"Bearer {self.api_key}"})
+            if limits is None:
+                limits = DEFAULT_CONNECTION_LIMITS
+            # HTTP/2 needs the optional h2 package; servers that only speak
+            # HTTP/1.1 are negotiated down transparently.
             if max_retries > 0:
-                transport = httpx.HTTPTransport(retries=max_retries)
+                # Connection failures are retried by httpx itself, throttled
+                # and gateway error responses by the wrapping RetryTransport.
+                transport = RetryTransport(
+                    httpx.HTTPTransport(
+                        retries=max_retries, limits=limits, http2=HTTP2_AVAILABLE
+                    ),
+                    max_retries=max_retries,
+                )
                 self.http_client = httpx.Client(
                     timeout=timeout, headers=headers, transport=transport
                 )
             else:
-                self.http_client = httpx.Client(timeout=timeout, headers=headers)
+                self.http_client = httpx.Client(
+                    timeout=timeout,
+                    headers=headers,
+                    limits=limits,
+                    http2=HTTP2_AVAILABLE,
+                )
         else:
             self.http_client = http_client
 
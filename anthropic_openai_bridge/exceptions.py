@@ -4,6 +4,10 @@ import httpx
 
 
 class APIError(Exception):
+    # BaseException keeps its own lazily created __dict__, so slots only
+    # move these two attributes out of it
+    __slots__ = ("request", "response")
+
     def __init__(
         self,
         message: str,
@@ -15,37 +19,55 @@ class APIError(Exception):
         self.request = request
         self.response = response
 
+    def __reduce__(self):
+        # BaseException only pickles __dict__; carry the slots along too
+        state = {**self.__dict__, "request": self.request, "response": self.response}
+        return type(self), self.args, state
+
 
 class AuthenticationError(APIError):
-    pass
+    __slots__ = ()
 
 
 class BadRequestError(APIError):
-    pass
+    __slots__ = ()
 
 
 class ConflictError(APIError):
-    pass
+    __slots__ = ()
 
 
 class InternalServerError(APIError):
-    pass
+    __slots__ = ()
 
 
 class NotFoundError(APIError):
-    pass
+    __slots__ = ()
 
 
 class PermissionDeniedError(APIError):
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(APIError):
-    pass
+    __slots__ = ()
 
 
 class UnprocessableEntityError(APIError):
-    pass
+    __slots__ = ()
+
+
+# Status codes with a dedicated error class; any other 5xx is an
+# InternalServerError and everything else a plain APIError.
+_STATUS_CODE_ERRORS = {
+    400: BadRequestError,
+    401: AuthenticationError,
+    403: PermissionDeniedError,
+    404: NotFoundError,
+    409: ConflictError,
+    422: UnprocessableEntityError,
+    429: RateLimitError,
+}
 
 
 def map_openai_error_to_anthropic(
@@ -64,23 +86,8 @@ def map_openai_error_to_anthropic(
         elif "message" in error_data:
             message = error_data["message"]
 
-    error_class = APIError
-
-    if status_code == 400:
-        error_class = BadRequestError
-    elif status_code == 401:
-        error_class = AuthenticationError
-    elif status_code == 403:
-        error_class = PermissionDeniedError
-    elif status_code == 404:
-        error_class = NotFoundError
-    elif status_code == 409:
-        error_class = ConflictError
-    elif status_code == 422:
-        error_class = UnprocessableEntityError
-    elif status_code == 429:
-        error_class = RateLimitError
-    elif status_code >= 500:
-        error_class = InternalServerError
+    error_class = _STATUS_CODE_ERRORS.get(status_code)
+    if error_class is None:
+        error_class = InternalServerError if status_code >= 500 else APIError
 
     return error_class(message, response=response)
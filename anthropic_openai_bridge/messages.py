@@ -10,18 +10,45 @@ from .streaming import (
 )
 from .transformers import transform_anthropic_to_openai, transform_openai_to_anthropic
 from .types import Message, StreamingEvent
-from .utils import log_request, log_response, measure_time
+from .utils import (
+    DEFAULT_CONNECTION_LIMITS,
+    HTTP2_AVAILABLE,
+    debug_logging_enabled,
+    json_dumps,
+    json_loads,
+    log_request,
+    log_response,
+    measure_time,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class Messages:
     def __init__(
-        self, api_key: str, base_url: str, http_client: Optional[httpx.Client] = None
+        self,
+        api_key: str,
+        base_url: str,
+        http_client: Optional[httpx.Client] = None,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
-        self.http_client = http_client or httpx.Client()
+        # Absolute so that caller-supplied clients without a base_url work too
+        self._url = f"{self.base_url}/chat/completions"
+        if http_client is None:
+            # Same pooling as the clients build; httpx's own defaults (20
+            # keep-alive connections) throttle concurrent callers.
+            http_client = httpx.Client(
+                timeout=60.0,
+                limits=DEFAULT_CONNECTION_LIMITS,
+                http2=HTTP2_AVAILABLE,
+            )
+        self.http_client = http_client
+        # Request headers never change for a given key, so build them once
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
 
     def create(
         self,
@@ -97,50 +124,64 @@ class Messages:
         if tool_choice is not None:
             anthropic_params["tool_choice"] = tool_choice
 
-        anthropic_params.update(kwargs)
+        if kwargs:
+            anthropic_params.update(kwargs)
 
         # Streaming and tools are now supported in Phase 2
 
         openai_params = transform_anthropic_to_openai(anthropic_params)
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        url = f"{self.base_url}/chat/completions"
+        # Skip building log payloads entirely when DEBUG logging is off
+        debug = debug_logging_enabled()
 
         start_time = measure_time()
-        log_request("POST", url, headers, openai_params)
+        if debug:
+            log_request("POST", self._url, self._headers, openai_params)
 
         try:
-            response = self.http_client.post(
-                url, headers=headers, json=openai_params, timeout=60.0
-            )
+            content = json_dumps(openai_params)
+            if stream:
+                # Send without reading the body so events are parsed as they
+                # arrive; post() would buffer the whole stream first.
+                request = self.http_client.build_request(
+                    "POST", self._url, headers=self._headers, content=content
+                )
+                response = self.http_client.send(request, stream=True)
+            else:
+                response = self.http_client.post(
+                    self._url, headers=self._headers, content=content
+                )
 
             duration = measure_time() - start_time
 
             if response.status_code != 200:
+                if stream:
+                    try:
+                        response.read()
+                    finally:
+                        response.close()
                 error_data = None
                 try:
-                    error_data = response.json()
+                    error_data = json_loads(response.content)
                 except Exception:
                     pass
 
-                log_response(response.status_code, error_data, duration)
+                if debug:
+                    log_response(response.status_code, error_data, duration)
                 raise map_openai_error_to_anthropic(
                     response.status_code, error_data, response
                 )
 
             # Handle streaming vs non-streaming responses
             if stream:
-                log_response(response.status_code, {"streaming": True}, duration)
+                if debug:
+                    log_response(response.status_code, {"streaming": True}, duration)
                 # Parse OpenAI streaming response and transform to Anthropic format
-                openai_events = parse_openai_streaming_response(response)
-                return transform_openai_stream_to_anthropic(openai_events)
+                return self._stream_events(response)
             else:
-                openai_response = response.json()
-                log_response(response.status_code, openai_response, duration)
+                openai_response = json_loads(response.content)
+                if debug:
+                    log_response(response.status_code, openai_response, duration)
 
                 anthropic_response = transform_openai_to_anthropic(openai_response)
                 return anthropic_response
@@ -154,3 +195,16 @@ class Messages:
         except Exception as e:
             logger.error(f"Unexpected error occurred: {e}")
             raise map_openai_error_to_anthropic(500, {"error": {"message": str(e)}})
+
+    def _stream_events(self, response: httpx.Response) -> Iterator[StreamingEvent]:
+        """Yield Anthropic events from a streamed response, then close it."""
+        try:
+            openai_events = parse_openai_streaming_response(response)
+            yield from transform_openai_stream_to_anthropic(openai_events)
+        except httpx.HTTPError as e:
+            # The body is read lazily now, so network errors surface here
+            # rather than in create()
+            logger.error(f"HTTP error occurred while streaming: {e}")
+            raise map_openai_error_to_anthropic(500, {"error": {"message": str(e)}})
+        finally:
+            response.close()
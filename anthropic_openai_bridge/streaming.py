@@ -4,11 +4,12 @@ Streaming utilities for handling Server-Sent Events (SSE) and streaming response
 
 import json
 import logging
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, cast
 
 import httpx
 
 from .types import (
+    OPENAI_TO_ANTHROPIC_STOP_REASON_MAP,
     ContentBlock,
     ContentBlockDelta,
     ContentBlockStart,
@@ -21,294 +22,369 @@ from .types import (
     ToolUse,
     Usage,
 )
+from .utils import json_loads
 
 logger = logging.getLogger(__name__)
 
+# Shared stand-in for chunks whose choice has no delta; never mutated
+_EMPTY_DELTA: Dict[str, Any] = {}
 
-class SSEParser:
-    """Parser for Server-Sent Events (SSE) format."""
 
-    @staticmethod
-    def parse_line(line: str) -> Optional[Dict[str, str]]:
-        """Parse a single SSE line."""
+def _sse_parse_line(line: str) -> Optional[Dict[str, str]]:
+    """Parse a single SSE line."""
+    line = line.strip()
+    if not line or line.startswith(":"):
+        return None
+
+    if ":" in line:
+        key, value = line.split(":", 1)
+        return {key.strip(): value.strip()}
+    else:
+        return {line: ""}
+
+
+def _sse_parse_event(lines: str) -> Optional[Dict[str, Any]]:
+    """Parse SSE event from multiple lines."""
+    event: Dict[str, Any] = {}
+    data_lines = []
+
+    for line in lines.split("\n"):
+        # OpenAI streams are almost entirely "data: ..." lines, so handle
+        # them inline instead of going through _sse_parse_line().
+        if line.startswith("data: "):
+            data_lines.append(line[6:].strip())
+            continue
+
         line = line.strip()
-        if not line or line.startswith(":"):
-            return None
+        if not line or line[0] == ":":
+            continue
 
-        if ":" in line:
-            key, value = line.split(":", 1)
-            return {key.strip(): value.strip()}
+        key, _, value = line.partition(":")
+        if key == "data":
+            data_lines.append(value.strip())
         else:
-            return {line: ""}
-
-    @staticmethod
-    def parse_event(lines: str) -> Optional[Dict[str, Any]]:
-        """Parse SSE event from multiple lines."""
-        event = {}
-        data_lines = []
-
-        for line in lines.split("\n"):
-            parsed = SSEParser.parse_line(line)
-            if parsed:
-                key, value = next(iter(parsed.items()))
-                if key == "data":
-                    data_lines.append(value)
-                else:
-                    event[key] = value
-
-        if data_lines:
-            data = "\n".join(data_lines)
-            if data == "[DONE]":
-                return {"event": "done"}
+            event[key.strip()] = value.strip()
+
+    if data_lines:
+        # OpenAI sends one data line per event; avoid the join copy
+        data = data_lines[0] if len(data_lines) == 1 else "\n".join(data_lines)
+        if data == "[DONE]":
+            return {"event": "done"}
+        try:
+            event["data"] = json_loads(data)
+        except json.JSONDecodeError:
+            event["data"] = data
+
+    return event if event else None
+
+
+class SSEParser:
+    """Parser for Server-Sent Events (SSE) format.
+
+    Kept for API compatibility; the streaming parsers call the module-level
+    functions directly.
+    """
+
+    __slots__ = ()
+
+    parse_line = staticmethod(_sse_parse_line)
+    parse_event = staticmethod(_sse_parse_event)
+
+
+class _SSEDecoder:
+    """Incrementally split a byte stream into decoded SSE ``data`` payloads.
+
+    Frame boundaries are located on the raw bytes, so each event is decoded
+    from UTF-8 exactly once. ``done`` is set once ``data: [DONE]`` is seen.
+    """
+
+    __slots__ = ("_buffer", "done")
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add a chunk and return the payloads of any completed events."""
+        buffer = self._buffer
+        # Earlier calls already normalised and scanned the buffered bytes, so
+        # only the new chunk plus the two bytes it may join with are looked
+        # at again. Rescanning a large partial frame on every chunk would be
+        # quadratic in its size.
+        tail = max(len(buffer) - 2, 0)
+        buffer += chunk
+        if buffer.find(b"\r", tail) != -1:
+            # Normalise CRLF framing; a lone trailing CR stays buffered until
+            # its LF arrives with the next chunk.
+            buffer[tail:] = buffer[tail:].replace(b"\r\n", b"\n")
+
+        payloads: List[Any] = []
+        if buffer.find(b"\n\n", tail) == -1:
+            return payloads
+
+        # At least one frame is complete; split them all out in one C call.
+        # The last piece is the start of the next, still partial, frame.
+        frames = buffer.split(b"\n\n")
+        self._buffer = frames.pop()
+        for frame in frames:
+            self._decode(frame, payloads)
+            if self.done:
+                break
+        return payloads
+
+    def flush(self) -> List[Any]:
+        """Return the payload of a final event not followed by a blank line."""
+        payloads: List[Any] = []
+        if not self.done and self._buffer.strip():
+            self._decode(self._buffer, payloads)
+        self._buffer.clear()
+        return payloads
+
+    def _decode(self, frame: bytearray, payloads: List[Any]) -> None:
+        # Fast path for the usual single "data: <json>" line: hand the bytes
+        # straight to the JSON decoder instead of decoding and re-splitting.
+        if frame.startswith(b"data: ") and b"\n" not in frame:
+            data = frame[6:].strip()
+            if data == b"[DONE]":
+                self.done = True
+                return
             try:
-                event["data"] = json.loads(data)
+                payloads.append(json_loads(data))
+                return
             except json.JSONDecodeError:
-                event["data"] = data
+                pass  # Not JSON; let the general parser keep it as text
 
-        return event if event else None
+        event = _sse_parse_event(frame.decode("utf-8"))
+        if not event:
+            return
+        if "data" in event:
+            payloads.append(event["data"])
+        elif event.get("event") == "done":
+            self.done = True
 
 
 def parse_openai_streaming_response(
     response: httpx.Response,
 ) -> Iterator[Dict[str, Any]]:
     """Parse OpenAI streaming response and yield events."""
-    buffer = ""
-
-    for chunk in response.iter_text():
-        buffer += chunk
+    decoder = _SSEDecoder()
 
-        while "\n\n" in buffer:
-            event_data, buffer = buffer.split("\n\n", 1)
-            event = SSEParser.parse_event(event_data)
+    for chunk in response.iter_bytes():
+        yield from decoder.feed(chunk)
+        if decoder.done:
+            return
 
-            if event:
-                if event.get("event") == "done":
-                    return
-                if "data" in event:
-                    yield event["data"]
+    yield from decoder.flush()
 
 
 async def parse_openai_streaming_response_async(
     response: httpx.Response,
 ) -> AsyncIterator[Dict[str, Any]]:
     """Parse OpenAI streaming response asynchronously and yield events."""
-    buffer = ""
-
-    async for chunk in response.aiter_text():
-        buffer += chunk
-
-        while "\n\n" in buffer:
-            event_data, buffer = buffer.split("\n\n", 1)
-            event = SSEParser.parse_event(event_data)
-
-            if event:
-                if event.get("event") == "done":
-                    return
-                if "data" in event:
-                    yield event["data"]
-
-
-def transform_openai_stream_to_anthropic(
-    openai_events: Iterator[Dict[str, Any]],
-) -> Iterator[StreamingEvent]:
-    """Transform OpenAI streaming events to Anthropic format."""
-    current_message = StreamingMessage()
-    content_blocks: List[Union[ContentBlock, ToolUse]] = []
+    decoder = _SSEDecoder()
+
+    async for chunk in response.aiter_bytes():
+        for data in decoder.feed(chunk):
+            yield data
+        if decoder.done:
+            return
+
+    for data in decoder.flush():
+        yield data
+
+
+class _StreamingTextBlock(ContentBlock):
+    """Text block that collects deltas and joins them only when read.
+
+    Appending to a str on every delta would copy the whole response text
+    each time; here the parts are joined (and collapsed) on access.
+    """
+
+    __slots__ = ("_parts",)
+
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+        super().__init__(type="text")
+
+    @property
+    def text(self) -> str:
+        parts = self._parts
+        if len(parts) > 1:
+            parts[:] = ["".join(parts)]
+        return parts[0] if parts else ""
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._parts[:] = [value] if value else []
+
+    def append(self, text: str) -> None:
+        self._parts.append(text)
+
+    def __reduce__(self):
+        # Copies and pickles are plain, already-joined ContentBlocks
+        return ContentBlock, (self.type, self.text)
+
+
+class _StreamState:
+    """Per-stream state carried across OpenAI chunks."""
+
+    __slots__ = (
+        "message",
+        "text_block",
+        "tool_block_indices",
+        "tool_arg_buffers",
+    )
+
+    def __init__(self) -> None:
+        self.message = StreamingMessage()
+        self.text_block: Optional[_StreamingTextBlock] = None
+        # Keyed by the OpenAI tool_call index
+        self.tool_block_indices: Dict[int, int] = {}
+        self.tool_arg_buffers: Dict[int, List[str]] = {}
+
+
+def _handle_openai_event(
+    event: Dict[str, Any], state: _StreamState
+) -> List[StreamingEvent]:
+    """Translate one OpenAI streaming chunk into Anthropic streaming events.
+
+    Shared by the sync and async transforms. Errors are contained to the
+    chunk that caused them so that transport errors raised by the event
+    iterator itself still propagate to the caller.
+    """
+    out: List[StreamingEvent] = []
+    current_message = state.message
+    # The message's own content list doubles as the block index
+    content_blocks = current_message.content
+
+    try:
+        # Chunks without choices (e.g. a trailing usage-only chunk) carry
+        # nothing to translate
+        choices = event.get("choices")
+        if not choices:
+            return out
+
+        choice = choices[0]
+        delta = choice.get("delta") or _EMPTY_DELTA
+        role = delta.get("role")
+        content = delta.get("content")
+        tool_calls = delta.get("tool_calls")
+        finish_reason = choice.get("finish_reason")
+
+        # Message start
+        if role:
+            current_message.id = event.get("id", "")
+            current_message.model = event.get("model", "")
+            current_message.role = role
+            out.append(MessageStart(message=current_message))
+
+        # Content delta
+        if content:
+            # If this is the first content, start a content block
+            text_block = state.text_block
+            if text_block is None and not content_blocks:
+                text_block = state.text_block = _StreamingTextBlock()
+                content_blocks.append(text_block)
+                out.append(ContentBlockStart(index=0, content_block=text_block))
+
+            if text_block is not None:
+                text_block.append(content)
+            out.append(ContentBlockDelta(index=0, delta={"text": content}))
+
+        # Tool calls (function calls in OpenAI). Arguments arrive as JSON
+        # fragments spread over many chunks, so buffer them per tool call
+        # and only parse once the message finishes.
+        if tool_calls:
+            for i, tool_call in enumerate(tool_calls):
+                func = tool_call.get("function")
+                if not func:
+                    continue
+
+                key = tool_call.get("index", i)
+                if key not in state.tool_block_indices:
+                    tool_use = ToolUse(
+                        id=tool_call.get("id", ""),
+                        name=func.get("name", ""),
+                        input={},
+                    )
+                    block_index = len(content_blocks)
+                    state.tool_block_indices[key] = block_index
+                    state.tool_arg_buffers[key] = []
+                    content_blocks.append(tool_use)
+                    out.append(
+                        ContentBlockStart(index=block_index, content_block=tool_use)
+                    )
 
-    for event in openai_events:
-        try:
-            # Handle different types of OpenAI streaming events
-            if "choices" not in event:
-                continue
-
-            choice = event["choices"][0]
-            delta = choice.get("delta", {})
-
-            # Message start
-            if delta.get("role"):
-                current_message.id = event.get("id", "")
-                current_message.model = event.get("model", "")
-                current_message.role = delta["role"]
-                yield MessageStart(message=current_message)
-
-            # Content delta
-            if "content" in delta and delta["content"]:
-                content = delta["content"]
-
-                # If this is the first content, start a content block
-                if not content_blocks:
-                    content_block = ContentBlock(type="text", text="")
-                    content_blocks.append(content_block)
-                    current_message.content.append(content_block)
-                    yield ContentBlockStart(index=0, content_block=content_block)
-
-                # Update the content block (check if it's a ContentBlock, not ToolUse)
-                if isinstance(content_blocks[0], ContentBlock):
-                    content_blocks[0].text += content
-                yield ContentBlockDelta(index=0, delta={"text": content})
-
-            # Tool calls (function calls in OpenAI)
-            if "tool_calls" in delta:
-                for i, tool_call in enumerate(delta["tool_calls"]):
-                    if tool_call.get("function"):
-                        func = tool_call["function"]
-                        tool_use = ToolUse(
-                            id=tool_call.get("id", ""),
-                            name=func.get("name", ""),
-                            input=(
-                                json.loads(func.get("arguments", "{}"))
-                                if func.get("arguments")
-                                else {}
-                            ),
+                arguments = func.get("arguments")
+                if arguments:
+                    state.tool_arg_buffers[key].append(arguments)
+
+        # Finish reason
+        if finish_reason:
+            # Tool inputs are complete now; parse and emit them
+            for key, block_index in state.tool_block_indices.items():
+                tool_block = cast(ToolUse, content_blocks[block_index])
+                raw_arguments = "".join(state.tool_arg_buffers[key])
+                if raw_arguments:
+                    try:
+                        tool_block.input = json_loads(raw_arguments)
+                    except json.JSONDecodeError:
+                        logger.warning(
+                            f"Invalid JSON arguments for tool call {tool_block.id}"
                         )
+                out.append(
+                    ContentBlockDelta(
+                        index=block_index,
+                        delta={"input": tool_block.input},
+                    )
+                )
 
-                        if len(content_blocks) <= i:
-                            content_blocks.append(tool_use)
-                            current_message.content.append(tool_use)
-                            yield ContentBlockStart(index=i, content_block=tool_use)
+            # Stop all active content blocks
+            for i in range(len(content_blocks)):
+                out.append(ContentBlockStop(index=i))
 
-                        # For tool calls, we typically get the full call at once
-                        yield ContentBlockDelta(
-                            index=i, delta={"input": tool_use.input}
-                        )
+            current_message.stop_reason = OPENAI_TO_ANTHROPIC_STOP_REASON_MAP.get(
+                finish_reason, "end_turn"
+            )
 
-            # Finish reason
-            finish_reason = choice.get("finish_reason")
-            if finish_reason:
-                # Stop all active content blocks
-                for i in range(len(content_blocks)):
-                    yield ContentBlockStop(index=i)
-
-                # Map finish reason
-                stop_reason_map = {
-                    "stop": "end_turn",
-                    "length": "max_tokens",
-                    "tool_calls": "tool_use",
-                    "function_call": "tool_use",
-                    "content_filter": "end_turn",
-                }
-
-                current_message.stop_reason = stop_reason_map.get(
-                    finish_reason, "end_turn"
+            # Usage information
+            if "usage" in event:
+                usage_data = event["usage"]
+                current_message.usage = Usage(
+                    input_tokens=usage_data.get("prompt_tokens", 0),
+                    output_tokens=usage_data.get("completion_tokens", 0),
                 )
 
-                # Usage information
-                if "usage" in event:
-                    usage_data = event["usage"]
-                    current_message.usage = Usage(
-                        input_tokens=usage_data.get("prompt_tokens", 0),
-                        output_tokens=usage_data.get("completion_tokens", 0),
-                    )
-
-                yield MessageDelta(
+            out.append(
+                MessageDelta(
                     delta={"stop_reason": current_message.stop_reason},
                     usage=current_message.usage,
                 )
-                yield MessageStop()
+            )
+            out.append(MessageStop())
 
-        except Exception as e:
-            logger.error(f"Error processing streaming event: {e}")
-            continue
+    except Exception as e:
+        logger.error(f"Error processing streaming event: {e}")
+
+    return out
+
+
+def transform_openai_stream_to_anthropic(
+    openai_events: Iterator[Dict[str, Any]],
+) -> Iterator[StreamingEvent]:
+    """Transform OpenAI streaming events to Anthropic format."""
+    state = _StreamState()
+
+    for event in openai_events:
+        yield from _handle_openai_event(event, state)
 
 
 async def transform_openai_stream_to_anthropic_async(
     openai_events: AsyncIterator[Dict[str, Any]],
 ) -> AsyncIterator[StreamingEvent]:
     """Transform OpenAI streaming events to Anthropic format asynchronously."""
-    current_message = StreamingMessage()
-    content_blocks: List[Union[ContentBlock, ToolUse]] = []
+    state = _StreamState()
 
     async for event in openai_events:
-        try:
-            # Handle different types of OpenAI streaming events
-            if "choices" not in event:
-                continue
-
-            choice = event["choices"][0]
-            delta = choice.get("delta", {})
-
-            # Message start
-            if delta.get("role"):
-                current_message.id = event.get("id", "")
-                current_message.model = event.get("model", "")
-                current_message.role = delta["role"]
-                yield MessageStart(message=current_message)
-
-            # Content delta
-            if "content" in delta and delta["content"]:
-                content = delta["content"]
-
-                # If this is the first content, start a content block
-                if not content_blocks:
-                    content_block = ContentBlock(type="text", text="")
-                    content_blocks.append(content_block)
-                    current_message.content.append(content_block)
-                    yield ContentBlockStart(index=0, content_block=content_block)
-
-                # Update the content block (check if it's a ContentBlock, not ToolUse)
-                if isinstance(content_blocks[0], ContentBlock):
-                    content_blocks[0].text += content
-                yield ContentBlockDelta(index=0, delta={"text": content})
-
-            # Tool calls (function calls in OpenAI)
-            if "tool_calls" in delta:
-                for i, tool_call in enumerate(delta["tool_calls"]):
-                    if tool_call.get("function"):
-                        func = tool_call["function"]
-                        tool_use = ToolUse(
-                            id=tool_call.get("id", ""),
-                            name=func.get("name", ""),
-                            input=(
-                                json.loads(func.get("arguments", "{}"))
-                                if func.get("arguments")
-                                else {}
-                            ),
-                        )
-
-                        if len(content_blocks) <= i:
-                            content_blocks.append(tool_use)
-                            current_message.content.append(tool_use)
-                            yield ContentBlockStart(index=i, content_block=tool_use)
-
-                        # For tool calls, we typically get the full call at once
-                        yield ContentBlockDelta(
-                            index=i, delta={"input": tool_use.input}
-                        )
-
-            # Finish reason
-            finish_reason = choice.get("finish_reason")
-            if finish_reason:
-                # Stop all active content blocks
-                for i in range(len(content_blocks)):
-                    yield ContentBlockStop(index=i)
-
-                # Map finish reason
-                stop_reason_map = {
-                    "stop": "end_turn",
-                    "length": "max_tokens",
-                    "tool_calls": "tool_use",
-                    "function_call": "tool_use",
-                    "content_filter": "end_turn",
-                }
-
-                current_message.stop_reason = stop_reason_map.get(
-                    finish_reason, "end_turn"
-                )
-
-                # Usage information
-                if "usage" in event:
-                    usage_data = event["usage"]
-                    current_message.usage = Usage(
-                        input_tokens=usage_data.get("prompt_tokens", 0),
-                        output_tokens=usage_data.get("completion_tokens", 0),
-                    )
-
-                yield MessageDelta(
-                    delta={"stop_reason": current_message.stop_reason},
-                    usage=current_message.usage,
-                )
-                yield MessageStop()
-
-        except Exception as e:
-            logger.error(f"Error processing streaming event: {e}")
-            continue
+        for anthropic_event in _handle_openai_event(event, state):
+            yield anthropic_event
@@ -1,11 +1,14 @@
-import json
 import logging
 from typing import Any, Dict, List, Optional, Union
 
 from ..types import AnthropicCreateParams, OpenAICreateParams
+from ..utils import json_dumps
 
 logger = logging.getLogger(__name__)
 
+# Anthropic string tool_choice values -> OpenAI; anything else maps to "auto"
+_TOOL_CHOICE_STRINGS = {"auto": "auto", "any": "required", "required": "required"}
+
 
 def transform_anthropic_to_openai(params: AnthropicCreateParams) -> OpenAICreateParams:
     """
@@ -61,14 +64,17 @@ def transform_anthropic_to_openai(params: AnthropicCreateParams) -> OpenAICreate
         openai_params["stream"] = params["stream"]
 
     # Transform tools to OpenAI function format
-    if "tools" in params and params["tools"]:
-        openai_params["tools"] = _transform_tools_to_functions(params["tools"])
+    tools = params.get("tools")
+    if tools:
+        openai_params["tools"] = _transform_tools_to_functions(tools)
 
     # Transform tool_choice
-    if "tool_choice" in params and params["tool_choice"]:
-        openai_params["tool_choice"] = _transform_tool_choice(params["tool_choice"])
+    tool_choice = params.get("tool_choice")
+    if tool_choice:
+        openai_params["tool_choice"] = _transform_tool_choice(tool_choice)
 
-    logger.debug(f"Transformed Anthropic params to OpenAI: {openai_params}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Transformed Anthropic params to OpenAI: %s", openai_params)
     return openai_params
 
 
@@ -119,7 +125,7 @@ def _transform_content_blocks(
                 "type": "function",
                 "function": {
                     "name": block.get("name", ""),
-                    "arguments": json.dumps(block.get("input", {})),
+                    "arguments": json_dumps(block.get("input", {})).decode("utf-8"),
                 },
             }
             tool_calls.append(tool_call)
@@ -133,36 +139,28 @@ def _transform_content_blocks(
             }
             tool_results.append(tool_result)
 
-    messages = []
-
-    # Create main message with text content and/or tool calls
-    if text_parts or tool_calls:
-        main_message = {"role": role}
-
-        if text_parts:
-            main_message["content"] = "\n".join(text_parts)
-
-        if tool_calls:
-            main_message["tool_calls"] = tool_calls  # type: ignore
-            # If there are tool calls but no text content, set empty content
-            if not text_parts:
-                main_message["content"] = ""
-
-        messages.append(main_message)
+    if not text_parts and not tool_calls:
+        # Only tool results (or nothing recognised); return an empty dict
+        # instead of None when there is nothing at all
+        return tool_results or {}
+
+    # Usually a single text block; skip the join for it. Tool calls
+    # without any text content get an empty content string.
+    if not text_parts:
+        content = ""
+    elif len(text_parts) == 1:
+        content = text_parts[0]
+    else:
+        content = "\n".join(text_parts)
 
-    # Add tool result messages
-    messages.extend(tool_results)
+    main_message = {"role": role, "content": content}
+    if tool_calls:
+        main_message["tool_calls"] = tool_calls  # type: ignore
 
-    # If we only have tool results, return the list
-    if len(messages) == 1 and tool_results:
-        return messages
-    elif len(messages) == 1:
-        return messages[0]
-    elif len(messages) > 1:
-        return messages
-    else:
-        # Return empty dict instead of None
-        return {}
+    # Tool results become separate messages after the main one
+    if tool_results:
+        return [main_message, *tool_results]
+    return main_message
 
 
 def _transform_tools_to_functions(
@@ -191,17 +189,11 @@ def _transform_tool_choice(
     """Transform Anthropic tool_choice to OpenAI format."""
     if isinstance(anthropic_tool_choice, str):
         # Handle string values: "auto", "any", "required"
-        if anthropic_tool_choice == "auto":
-            return "auto"
-        elif anthropic_tool_choice == "any" or anthropic_tool_choice == "required":
-            return "required"
-        else:
-            return "auto"
+        return _TOOL_CHOICE_STRINGS.get(anthropic_tool_choice, "auto")
 
     elif isinstance(anthropic_tool_choice, dict):
         # Handle specific tool choice
-        tool_type = anthropic_tool_choice.get("type")
-        if tool_type == "tool":
+        if anthropic_tool_choice.get("type") == "tool":
             tool_name = anthropic_tool_choice.get("name")
             if tool_name:
                 return {"type": "function", "function": {"name": tool_name}}
@@ -217,4 +209,6 @@ def _extract_text_from_content_blocks(content_blocks: List[Dict[str, Any]]) -> s
         if block.get("type") == "text" and "text" in block:
             text_parts.append(block["text"])
 
-    return "\n".join(text_parts) if text_parts else ""
+    if not text_parts:
+        return ""
+    return text_parts[0] if len(text_parts) == 1 else "\n".join(text_parts)
@@ -10,9 +10,12 @@ from ..types import (
     ToolUse,
     Usage,
 )
+from ..utils import json_loads
 
 logger = logging.getLogger(__name__)
 
+_map_finish_reason = OPENAI_TO_ANTHROPIC_STOP_REASON_MAP.get
+
 
 def transform_openai_to_anthropic(openai_response: Dict[str, Any]) -> Message:
     """
@@ -41,34 +44,36 @@ def transform_openai_to_anthropic(openai_response: Dict[str, Any]) -> Message:
         >>> msg.content[0].text
         'Hello!'
     """
-    choice = openai_response["choices"][0] if openai_response.get("choices") else {}
+    choices = openai_response.get("choices")
+    choice = choices[0] if choices else {}
     message = choice.get("message", {})
 
     content_blocks: List[Union[ContentBlock, ToolUse]] = []
 
     # Handle text content
-    if message.get("content"):
-        content_blocks.append(ContentBlock(type="text", text=message["content"]))
+    text = message.get("content")
+    if text:
+        content_blocks.append(ContentBlock(type="text", text=text))
 
     # Handle tool calls (function calls in OpenAI)
-    if message.get("tool_calls"):
-        for tool_call in message["tool_calls"]:
+    tool_calls = message.get("tool_calls")
+    if tool_calls:
+        for tool_call in tool_calls:
             if tool_call.get("function"):
                 func = tool_call["function"]
-                try:
-                    arguments = json.loads(func.get("arguments", "{}"))
-                except json.JSONDecodeError:
-                    arguments = {}
-
                 tool_use = ToolUse(
                     id=tool_call.get("id", ""),
                     name=func.get("name", ""),
-                    input=arguments,
+                    input=_parse_tool_arguments(func.get("arguments")),
                 )
                 content_blocks.append(tool_use)
 
     finish_reason = choice.get("finish_reason")
-    stop_reason = _map_finish_reason_to_stop_reason(finish_reason)
+    stop_reason = (
+        _map_finish_reason(finish_reason, "end_turn")
+        if finish_reason is not None
+        else None
+    )
 
     usage_data = openai_response.get("usage", {})
     usage = Usage(
@@ -76,8 +81,13 @@ def transform_openai_to_anthropic(openai_response: Dict[str, Any]) -> Message:
         output_tokens=usage_data.get("completion_tokens", 0),
     )
 
+    # Only pay for a uuid when the upstream response has no id
+    response_id = openai_response.get("id")
+    if response_id is None:
+        response_id = f"msg_{uuid.uuid4().hex}"
+
     anthropic_response = Message(
-        id=openai_response.get("id", f"msg_{uuid.uuid4().hex}"),
+        id=response_id,
         content=content_blocks,
         model=openai_response.get("model", "unknown"),
         role="assistant",
@@ -87,12 +97,23 @@ def transform_openai_to_anthropic(openai_response: Dict[str, Any]) -> Message:
         usage=usage,
     )
 
-    logger.debug(f"Transformed OpenAI response to Anthropic: {anthropic_response}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Transformed OpenAI response to Anthropic: %s", anthropic_response)
     return anthropic_response
 
 
-def _map_finish_reason_to_stop_reason(finish_reason: Optional[str]) -> Optional[str]:
-    if finish_reason is None:
-        return None
+def _parse_tool_arguments(arguments: Optional[str]) -> Any:
+    """Decode tool call arguments, falling back to {} when they are not JSON."""
+    if not arguments:
+        return {}
+
+    # Malformed arguments are common from some backends; reject obvious
+    # non-JSON up front rather than raising and catching a decode error.
+    arguments = arguments.strip()
+    if arguments[:1] not in ("{", "[") or arguments[-1:] not in ("}", "]"):
+        return {}
 
-    return OPENAI_TO_ANTHROPIC_STOP_REASON_MAP.get(finish_reason, "end_turn")
+    try:
+        return json_loads(arguments)
+    except json.JSONDecodeError:
+        return {}
@@ -1,26 +1,33 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, FrozenSet, List, Literal, Optional, Union
 
 
-@dataclass
+class _DictAccess:
+    """Dict-style read access (``obj["key"]``) for the response types."""
+
+    __slots__ = ()
+    _KEYS: FrozenSet[str] = frozenset()
+
+    def __getitem__(self, key: str):
+        if key in self._KEYS:
+            return getattr(self, key)
+        raise KeyError(f"'{key}' is not a valid key")
+
+
+@dataclass(slots=True)
 class AnthropicMessage:
     role: Literal["user", "assistant"]
     content: Union[str, List[Dict[str, Any]]]
 
 
-class Usage:
+class Usage(_DictAccess):
+    __slots__ = ("input_tokens", "output_tokens")
+    _KEYS = frozenset(__slots__)
+
     def __init__(self, input_tokens: int, output_tokens: int):
         self.input_tokens = input_tokens
         self.output_tokens = output_tokens
 
-    def __getitem__(self, key: str):
-        if key == "input_tokens":
-            return self.input_tokens
-        elif key == "output_tokens":
-            return self.output_tokens
-        else:
-            raise KeyError(f"'{key}' is not a valid key")
-
     def __repr__(self):
         return (
             f"Usage(input_tokens={self.input_tokens}, "
@@ -28,24 +35,31 @@ class Usage:
         )
 
 
-class ContentBlock:
+class ContentBlock(_DictAccess):
+    __slots__ = ("type", "text")
+    _KEYS = frozenset(__slots__)
+
     def __init__(self, type: str, text: str = ""):
         self.type = type
         self.text = text
 
-    def __getitem__(self, key: str):
-        if key == "type":
-            return self.type
-        elif key == "text":
-            return self.text
-        else:
-            raise KeyError(f"'{key}' is not a valid key")
-
     def __repr__(self):
         return f"ContentBlock(type='{self.type}', text='{self.text}')"
 
 
-class Message:
+class Message(_DictAccess):
+    __slots__ = (
+        "id",
+        "type",
+        "role",
+        "content",
+        "model",
+        "stop_reason",
+        "stop_sequence",
+        "usage",
+    )
+    _KEYS = frozenset(__slots__)
+
     def __init__(
         self,
         id: str,
@@ -66,26 +80,6 @@ class Message:
         self.stop_sequence = stop_sequence
         self.usage = usage
 
-    def __getitem__(self, key: str):
-        if key == "id":
-            return self.id
-        elif key == "type":
-            return self.type
-        elif key == "role":
-            return self.role
-        elif key == "content":
-            return self.content
-        elif key == "model":
-            return self.model
-        elif key == "stop_reason":
-            return self.stop_reason
-        elif key == "stop_sequence":
-            return self.stop_sequence
-        elif key == "usage":
-            return self.usage
-        else:
-            raise KeyError(f"'{key}' is not a valid key")
-
     def __repr__(self):
         return (
             f"Message(id='{self.id}', content={self.content}, "
@@ -93,13 +87,13 @@ class Message:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AnthropicUsage:
     input_tokens: int
     output_tokens: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AnthropicResponse:
     id: str
     type: Literal["message"]
@@ -111,7 +105,7 @@ class AnthropicResponse:
     usage: AnthropicUsage
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenAIMessage:
     role: str
     content: Optional[str] = None
@@ -121,7 +115,7 @@ class OpenAIMessage:
     tool_call_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenAIChoice:
     index: int
     message: OpenAIMessage
@@ -129,14 +123,14 @@ class OpenAIChoice:
     finish_reason: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenAIUsage:
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenAIResponse:
     id: str
     object: str
@@ -152,47 +146,27 @@ OpenAICreateParams = Dict[str, Any]
 
 
 # Tool-related types
-@dataclass
-class ToolUse:
+@dataclass(slots=True)
+class ToolUse(_DictAccess):
     id: str
     name: str
     input: Dict[str, Any]
     type: str = "tool_use"
 
-    def __getitem__(self, key: str):
-        if key == "id":
-            return self.id
-        elif key == "name":
-            return self.name
-        elif key == "input":
-            return self.input
-        elif key == "type":
-            return self.type
-        else:
-            raise KeyError(f"'{key}' is not a valid key")
+    _KEYS = frozenset({"id", "name", "input", "type"})
 
     def __repr__(self):
         return f"ToolUse(id='{self.id}', name='{self.name}', input={self.input})"
 
 
-@dataclass
-class ToolResult:
+@dataclass(slots=True)
+class ToolResult(_DictAccess):
     tool_use_id: str
     content: Union[str, List[Dict[str, Any]]]
     is_error: bool = False
     type: str = "tool_result"
 
-    def __getitem__(self, key: str):
-        if key == "tool_use_id":
-            return self.tool_use_id
-        elif key == "content":
-            return self.content
-        elif key == "is_error":
-            return self.is_error
-        elif key == "type":
-            return self.type
-        else:
-            raise KeyError(f"'{key}' is not a valid key")
+    _KEYS = frozenset({"tool_use_id", "content", "is_error", "type"})
 
     def __repr__(self):
         return (
@@ -205,7 +179,7 @@ class ToolResult:
 ContentBlockType = Union[ContentBlock, ToolUse]
 
 
-@dataclass
+@dataclass(slots=True)
 class AnthropicTool:
     name: str
     description: str
@@ -213,24 +187,31 @@ class AnthropicTool:
 
 
 # Streaming types
-class StreamingContentBlock:
+class StreamingContentBlock(_DictAccess):
+    __slots__ = ("type", "text")
+    _KEYS = frozenset(__slots__)
+
     def __init__(self, type: str, text: str = ""):
         self.type = type
         self.text = text
 
-    def __getitem__(self, key: str):
-        if key == "type":
-            return self.type
-        elif key == "text":
-            return self.text
-        else:
-            raise KeyError(f"'{key}' is not a valid key")
-
     def __repr__(self):
         return f"StreamingContentBlock(type='{self.type}', text='{self.text}')"
 
 
-class StreamingMessage:
+class StreamingMessage(_DictAccess):
+    __slots__ = (
+        "id",
+        "type",
+        "role",
+        "content",
+        "model",
+        "stop_reason",
+        "stop_sequence",
+        "usage",
+    )
+    _KEYS = frozenset(__slots__)
+
     def __init__(
         self,
         id: str = "",
@@ -251,26 +232,6 @@ class StreamingMessage:
         self.stop_sequence = stop_sequence
         self.usage = usage
 
-    def __getitem__(self, key: str):
-        if key == "id":
-            return self.id
-        elif key == "type":
-            return self.type
-        elif key == "role":
-            return self.role
-        elif key == "content":
-            return self.content
-        elif key == "model":
-            return self.model
-        elif key == "stop_reason":
-            return self.stop_reason
-        elif key == "stop_sequence":
-            return self.stop_sequence
-        elif key == "usage":
-            return self.usage
-        else:
-            raise KeyError(f"'{key}' is not a valid key")
-
     def __repr__(self):
         return (
             f"StreamingMessage(id='{self.id}', content={self.content}, "
@@ -278,7 +239,10 @@ class StreamingMessage:
         )
 
 
-class MessageDelta:
+class MessageDelta(_DictAccess):
+    __slots__ = ("type", "delta", "usage")
+    _KEYS = frozenset(__slots__)
+
     def __init__(
         self,
         type: str = "message_delta",
@@ -289,23 +253,16 @@ class MessageDelta:
         self.delta = delta or {}
         self.usage = usage
 
-    def __getitem__(self, key: str):
-        if key == "type":
-            return self.type
-        elif key == "delta":
-            return self.delta
-        elif key == "usage":
-            return self.usage
-        else:
-            raise KeyError(f"'{key}' is not a valid key")
-
     def __repr__(self):
         return (
             f"MessageDelta(type='{self.type}', delta={self.delta}, usage={self.usage})"
         )
 
 
-class ContentBlockDelta:
+class ContentBlockDelta(_DictAccess):
+    __slots__ = ("type", "index", "delta")
+    _KEYS = frozenset(__slots__)
+
     def __init__(
         self,
         type: str = "content_block_delta",
@@ -316,16 +273,6 @@ class ContentBlockDelta:
         self.index = index
         self.delta = delta or {}
 
-    def __getitem__(self, key: str):
-        if key == "type":
-            return self.type
-        elif key == "index":
-            return self.index
-        elif key == "delta":
-            return self.delta
-        else:
-            raise KeyError(f"'{key}' is not a valid key")
-
     def __repr__(self):
         return (
             f"ContentBlockDelta(type='{self.type}', index={self.index}, "
@@ -333,7 +280,10 @@ class ContentBlockDelta:
         )
 
 
-class ContentBlockStart:
+class ContentBlockStart(_DictAccess):
+    __slots__ = ("type", "index", "content_block")
+    _KEYS = frozenset(__slots__)
+
     def __init__(
         self,
         type: str = "content_block_start",
@@ -344,16 +294,6 @@ class ContentBlockStart:
         self.index = index
         self.content_block = content_block
 
-    def __getitem__(self, key: str):
-        if key == "type":
-            return self.type
-        elif key == "index":
-            return self.index
-        elif key == "content_block":
-            return self.content_block
-        else:
-            raise KeyError(f"'{key}' is not a valid key")
-
     def __repr__(self):
         return (
             f"ContentBlockStart(type='{self.type}', index={self.index}, "
@@ -361,7 +301,10 @@ class ContentBlockStart:
         )
 
 
-class ContentBlockStop:
+class ContentBlockStop(_DictAccess):
+    __slots__ = ("type", "index")
+    _KEYS = frozenset(__slots__)
+
     def __init__(
         self,
         type: str = "content_block_stop",
@@ -370,19 +313,14 @@ class ContentBlockStop:
         self.type = type
         self.index = index
 
-    def __getitem__(self, key: str):
-        if key == "type":
-            return self.type
-        elif key == "index":
-            return self.index
-        else:
-            raise KeyError(f"'{key}' is not a valid key")
-
     def __repr__(self):
         return f"ContentBlockStop(type='{self.type}', index={self.index})"
 
 
-class MessageStart:
+class MessageStart(_DictAccess):
+    __slots__ = ("type", "message")
+    _KEYS = frozenset(__slots__)
+
     def __init__(
         self,
         type: str = "message_start",
@@ -391,28 +329,17 @@ class MessageStart:
         self.type = type
         self.message = message or StreamingMessage()
 
-    def __getitem__(self, key: str):
-        if key == "type":
-            return self.type
-        elif key == "message":
-            return self.message
-        else:
-            raise KeyError(f"'{key}' is not a valid key")
-
     def __repr__(self):
         return f"MessageStart(type='{self.type}', message={self.message})"
 
 
-class MessageStop:
+class MessageStop(_DictAccess):
+    __slots__ = ("type",)
+    _KEYS = frozenset(__slots__)
+
     def __init__(self, type: str = "message_stop"):
         self.type = type
 
-    def __getitem__(self, key: str):
-        if key == "type":
-            return self.type
-        else:
-            raise KeyError(f"'{key}' is not a valid key")
-
     def __repr__(self):
         return f"MessageStop(type='{self.type}')"
 
@@ -1,18 +1,131 @@
+import asyncio
+import atexit
+import email.utils
+import functools
+import importlib.util
 import json
 import logging
+import logging.handlers
+import math
+import queue
+import re
 import time
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Union
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# h2 is only needed by httpx itself; installed via the httpx[http2] extra
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for clients built by the bridge itself. httpx's
+# defaults (20 keep-alive connections) throttle highly concurrent callers.
+DEFAULT_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30
+)
+
+# Responses worth retrying at the transport level, before they are mapped to
+# RateLimitError / InternalServerError. Chat completions are not idempotent,
+# so a plain 500 (which may follow a billed generation) is not retried; these
+# codes mean the request was throttled or never reached a healthy backend.
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Upper bound on a single backoff, including server-sent Retry-After values
+MAX_RETRY_DELAY = 60.0
+
+# Keys (and header names) whose values are redacted from debug logs
+_SENSITIVE_KEY_RE = re.compile(
+    r"api[_-]?key|token|authoriz|password|secret|bearer|cookie", re.IGNORECASE
+)
+
+
+def json_loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any) -> bytes:
+    """Encode ``data`` as a compact UTF-8 JSON request body."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
 
 def setup_logging(level: int = logging.INFO) -> None:
+    # Records are formatted on the calling thread but written to stderr by a
+    # background listener, so request threads never block on the stream.
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
     logging.basicConfig(
         level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler()],
+        handlers=[queue_handler],
     )
 
+    # basicConfig() does nothing if the root logger is already configured
+    if queue_handler in logging.getLogger().handlers:
+        listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+        listener.start()
+        atexit.register(listener.stop)
+
+
+def _json_pretty(data: Any) -> str:
+    if orjson is not None:
+        # OPT_NON_STR_KEYS matches the stdlib fallback, which accepts int keys
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+class _MaskedHeaders:
+    """Headers with credentials masked when the log record is formatted."""
+
+    __slots__ = ("_headers",)
+
+    def __init__(self, headers: Dict[str, str]) -> None:
+        self._headers = headers
+
+    def __str__(self) -> str:
+        return str(
+            {
+                k: ("***" if _is_sensitive_key(k) else v)
+                for k, v in self._headers.items()
+            }
+        )
+
+    __repr__ = __str__
+
+
+class _LazyJSON:
+    """Log payload, pretty-printed only when the log record is formatted."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Any) -> None:
+        self._data = data
+
+    def __str__(self) -> str:
+        if isinstance(self._data, dict):
+            return _json_pretty(self._data)
+        return str(self._data)
+
+    __repr__ = __str__
+
+
+def debug_logging_enabled() -> bool:
+    """Return True if log_request/log_response would emit anything."""
+    return logger.isEnabledFor(logging.DEBUG)
+
 
 def log_request(
     method: str,
@@ -21,48 +134,41 @@ def log_request(
     data: Optional[Any] = None,
 ) -> None:
     if logger.isEnabledFor(logging.DEBUG):
-        logger.debug(f"Request: {method} {url}")
+        # %-style arguments are only rendered if a handler emits the record
+        logger.debug("Request: %s %s", method, url)
         if headers:
-            sanitized_headers = {
-                k: ("***" if "authorization" in k.lower() else v)
-                for k, v in headers.items()
-            }
-            logger.debug(f"Headers: {sanitized_headers}")
+            logger.debug("Headers: %s", _MaskedHeaders(headers))
         if data:
-            if isinstance(data, dict):
-                data_str = json.dumps(data, indent=2)
-            else:
-                data_str = str(data)
-            logger.debug(f"Data: {data_str}")
+            logger.debug("Data: %s", _LazyJSON(data))
 
 
 def log_response(
     status_code: int, data: Optional[Any] = None, duration: Optional[float] = None
 ) -> None:
     if logger.isEnabledFor(logging.DEBUG):
-        logger.debug(f"Response: {status_code}")
+        logger.debug("Response: %s", status_code)
         if duration:
-            logger.debug(f"Duration: {duration:.3f}s")
+            logger.debug("Duration: %.3fs", duration)
         if data:
-            if isinstance(data, dict):
-                data_str = json.dumps(data, indent=2)
-            else:
-                data_str = str(data)
-            logger.debug(f"Response data: {data_str}")
+            logger.debug("Response data: %s", _LazyJSON(data))
+
 
+def measure_time() -> float:
+    # Monotonic, high-resolution clock; only differences are meaningful
+    return time.perf_counter()
 
-def measure_time():
-    return time.time()
+
+# Payloads reuse a small vocabulary of key names, so memoise the check
+@functools.lru_cache(maxsize=1024)
+def _is_sensitive_key(key: str) -> bool:
+    return _SENSITIVE_KEY_RE.search(key) is not None
 
 
 def sanitize_for_logging(data: Any) -> Any:
     if isinstance(data, dict):
         sanitized = {}
         for key, value in data.items():
-            if any(
-                sensitive in key.lower()
-                for sensitive in ["api_key", "token", "authorization", "password"]
-            ):
+            if _is_sensitive_key(key):
                 sanitized[key] = "***"
             elif isinstance(value, (dict, list)):
                 sanitized[key] = sanitize_for_logging(value)
@@ -73,3 +179,90 @@ def sanitize_for_logging(data: Any) -> Any:
         return [sanitize_for_logging(item) for item in data]
     else:
         return data
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return the delay a Retry-After header asks for, in seconds."""
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        pass
+    else:
+        return max(delay, 0.0) if math.isfinite(delay) else None
+
+    # Otherwise an HTTP-date
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _retry_delay(
+    response: httpx.Response, attempt: int, backoff_factor: float
+) -> float:
+    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+    if retry_after is not None:
+        return min(retry_after, MAX_RETRY_DELAY)
+    return min(backoff_factor * (2**attempt), MAX_RETRY_DELAY)
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Retry 429/502/503/504 responses with exponential backoff.
+
+    Retrying below the client means the request is neither re-transformed
+    nor re-encoded; the final response is returned as-is once retries run
+    out and mapped to an exception by the caller.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        max_retries: int,
+        backoff_factor: float = 0.5,
+    ) -> None:
+        self._transport = transport
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(self._max_retries):
+            response = self._transport.handle_request(request)
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+            response.close()
+            time.sleep(_retry_delay(response, attempt, self._backoff_factor))
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of RetryTransport."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        max_retries: int,
+        backoff_factor: float = 0.5,
+    ) -> None:
+        self._transport = transport
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(self._max_retries):
+            response = await self._transport.handle_async_request(request)
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+            await response.aclose()
+            await asyncio.sleep(_retry_delay(response, attempt, self._backoff_factor))
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
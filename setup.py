@@ -33,10 +33,17 @@ setup(
         "httpx>=0.24.0",
     ],
     extras_require={
+        "speedups": [
+            "orjson>=3.8.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
             "pytest-asyncio>=0.21.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "isort>=5.12.0",
             "mypy>=1.0.0",
@@ -1,4 +1,5 @@
 import asyncio
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
@@ -7,6 +8,8 @@ import pytest
 from anthropic_openai_bridge import AsyncAnthropicClient
 from anthropic_openai_bridge.types import (ContentBlockDelta, MessageStart,
                                            MessageStop)
+from anthropic_openai_bridge.utils import (DEFAULT_CONNECTION_LIMITS,
+                                           HTTP2_AVAILABLE)
 
 
 class TestAsyncClient:
@@ -20,6 +23,77 @@ class TestAsyncClient:
         assert client.base_url == "https://api.test.com/v1"
         assert client.messages is not None
 
+    @pytest.mark.asyncio
+    async def test_async_client_builds_pooled_http_client(self):
+        with patch(
+            "httpx.AsyncHTTPTransport", wraps=httpx.AsyncHTTPTransport
+        ) as mock_transport:
+            client = AsyncAnthropicClient(api_key="test-key", timeout=30.0)
+
+        http_client = client.messages.http_client
+        assert isinstance(http_client, httpx.AsyncClient)
+        assert http_client.headers["Authorization"] == "Bearer test-key"
+        assert http_client.timeout.read == 30.0
+        mock_transport.assert_any_call(
+            retries=2, limits=DEFAULT_CONNECTION_LIMITS, http2=HTTP2_AVAILABLE
+        )
+
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_async_client_custom_limits(self):
+        limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+        with patch(
+            "httpx.AsyncHTTPTransport", wraps=httpx.AsyncHTTPTransport
+        ) as mock_transport:
+            client = AsyncAnthropicClient(api_key="test-key", limits=limits)
+
+        async with client:
+            mock_transport.assert_any_call(
+                retries=2, limits=limits, http2=HTTP2_AVAILABLE
+            )
+
+    @pytest.mark.asyncio
+    async def test_default_clients_share_http_client_per_loop(self):
+        async with AsyncAnthropicClient(api_key="key-a") as first:
+            pass
+        second = AsyncAnthropicClient(api_key="key-b")
+
+        shared = first.messages.http_client
+        assert second.messages.http_client is shared
+        # Leaving the context manager must not close the shared pool
+        assert not shared.is_closed
+        # Credentials are per request, not baked into the shared client
+        assert "Authorization" not in shared.headers
+        assert second.messages._headers["Authorization"] == "Bearer key-b"
+
+    def test_shared_http_client_closed_with_its_loop(self):
+        async def shared_client():
+            return AsyncAnthropicClient(api_key="test-key").messages.http_client
+
+        first = asyncio.run(shared_client())
+        second = asyncio.run(shared_client())
+
+        assert first is not second
+        assert first.is_closed
+        assert second.is_closed
+
+    @pytest.mark.asyncio
+    async def test_configured_client_gets_own_http_client(self):
+        default = AsyncAnthropicClient(api_key="test-key")
+        async with AsyncAnthropicClient(api_key="test-key", timeout=5.0) as client:
+            http_client = client.messages.http_client
+            assert http_client is not default.messages.http_client
+        assert http_client.is_closed
+
+    def test_client_created_outside_event_loop_gets_own_http_client(self):
+        first = AsyncAnthropicClient(api_key="test-key")
+        second = AsyncAnthropicClient(api_key="test-key")
+        assert first.messages.http_client is not second.messages.http_client
+
+        asyncio.run(first.messages.http_client.aclose())
+        asyncio.run(second.messages.http_client.aclose())
+
     @pytest.mark.asyncio
     async def test_async_context_manager(self):
         async with AsyncAnthropicClient(api_key="test-key") as client:
@@ -30,23 +104,29 @@ class TestAsyncClient:
     async def test_async_message_creation(self, mock_post):
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "chatcmpl-123",
-            "object": "chat.completion",
-            "created": 1677652288,
-            "model": "gpt-3.5-turbo",
-            "choices": [
-                {
-                    "index": 0,
-                    "message": {
-                        "role": "assistant",
-                        "content": "Hello! How can I help you today?",
-                    },
-                    "finish_reason": "stop",
-                }
-            ],
-            "usage": {"prompt_tokens": 9, "completion_tokens": 12, "total_tokens": 21},
-        }
+        mock_response.content = json.dumps(
+            {
+                "id": "chatcmpl-123",
+                "object": "chat.completion",
+                "created": 1677652288,
+                "model": "gpt-3.5-turbo",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {
+                            "role": "assistant",
+                            "content": "Hello! How can I help you today?",
+                        },
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 9,
+                    "completion_tokens": 12,
+                    "total_tokens": 21,
+                },
+            }
+        ).encode()
 
         # Configure mock to return the response directly
         mock_post.return_value = mock_response
@@ -71,28 +151,28 @@ class TestAsyncClient:
         mock_post.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("anthropic_openai_bridge.async_messages.httpx.AsyncClient.post")
-    async def test_async_streaming(self, mock_post):
+    @patch("anthropic_openai_bridge.async_messages.httpx.AsyncClient.send")
+    async def test_async_streaming(self, mock_send):
         # Mock async streaming response
-        mock_response = Mock()
+        mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
 
-        # Create an async iterator for aiter_text
-        async def mock_aiter_text():
+        # Create an async iterator for aiter_bytes
+        async def mock_aiter_bytes():
             chunks = [
-                'data: {"id":"chatcmpl-123","choices":[{"delta":{"role":"assistant"}}]}\n\n',
-                'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":"Hello"}}]}\n\n',
-                'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":" world"}}]}\n\n',
-                'data: {"id":"chatcmpl-123","choices":[{"finish_reason":"stop"}],"usage":{"prompt_tokens":10,"completion_tokens":5}}\n\n',
-                "data: [DONE]\n\n",
+                b'data: {"id":"chatcmpl-123","choices":[{"delta":{"role":"assistant"}}]}\n\n',
+                b'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":"Hello"}}]}\n\n',
+                b'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":" world"}}]}\n\n',
+                b'data: {"id":"chatcmpl-123","choices":[{"finish_reason":"stop"}],"usage":{"prompt_tokens":10,"completion_tokens":5}}\n\n',
+                b"data: [DONE]\n\n",
             ]
             for chunk in chunks:
                 yield chunk
 
-        mock_response.aiter_text.return_value = mock_aiter_text()
+        mock_response.aiter_bytes.return_value = mock_aiter_bytes()
 
         # Configure mock to return the response directly
-        mock_post.return_value = mock_response
+        mock_send.return_value = mock_response
 
         client = AsyncAnthropicClient(api_key="test-key")
 
@@ -121,34 +201,77 @@ class TestAsyncClient:
         # Last event should be message stop
         assert isinstance(events[-1], MessageStop)
 
+    @pytest.mark.asyncio
+    @patch("anthropic_openai_bridge.async_messages.httpx.AsyncClient.send")
+    async def test_async_streaming_split_chunks(self, mock_send):
+        # Real transports split bytes anywhere, including inside JSON
+        mock_response = Mock(spec=httpx.Response)
+        mock_response.status_code = 200
+
+        async def mock_aiter_bytes():
+            chunks = [
+                b'data: {"id":"x","cho',
+                b'ices":[{"delta":{"role":"assistant"}}]}\n',
+                b'\ndata: {"id":"x","choices":[{"delta":{"content":"caf\xc3',
+                b'\xa9"}}]}\n\ndata: {"id":"x","choices":[{"finish_reason":"stop"}]}',
+                b"\n\ndata: [DONE]\n\n",
+            ]
+            for chunk in chunks:
+                yield chunk
+
+        mock_response.aiter_bytes.return_value = mock_aiter_bytes()
+        mock_send.return_value = mock_response
+
+        client = AsyncAnthropicClient(api_key="test-key")
+
+        stream = await client.messages.create(
+            model="gpt-3.5-turbo",
+            max_tokens=1000,
+            messages=[{"role": "user", "content": "Hello"}],
+            stream=True,
+        )
+        events = [event async for event in stream]
+
+        assert isinstance(events[0], MessageStart)
+        assert events[0].message.id == "x"
+        content_deltas = [e for e in events if isinstance(e, ContentBlockDelta)]
+        assert [e.delta["text"] for e in content_deltas] == ["café"]
+        assert isinstance(events[-1], MessageStop)
+
     @pytest.mark.asyncio
     @patch("anthropic_openai_bridge.async_messages.httpx.AsyncClient.post")
     async def test_async_tool_calling(self, mock_post):
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "chatcmpl-123",
-            "choices": [
-                {
-                    "message": {
-                        "role": "assistant",
-                        "content": "I'll check the weather for you.",
-                        "tool_calls": [
-                            {
-                                "id": "call_123",
-                                "type": "function",
-                                "function": {
-                                    "name": "get_weather",
-                                    "arguments": '{"location": "New York"}',
-                                },
-                            }
-                        ],
-                    },
-                    "finish_reason": "tool_calls",
-                }
-            ],
-            "usage": {"prompt_tokens": 20, "completion_tokens": 15, "total_tokens": 35},
-        }
+        mock_response.content = json.dumps(
+            {
+                "id": "chatcmpl-123",
+                "choices": [
+                    {
+                        "message": {
+                            "role": "assistant",
+                            "content": "I'll check the weather for you.",
+                            "tool_calls": [
+                                {
+                                    "id": "call_123",
+                                    "type": "function",
+                                    "function": {
+                                        "name": "get_weather",
+                                        "arguments": '{"location": "New York"}',
+                                    },
+                                }
+                            ],
+                        },
+                        "finish_reason": "tool_calls",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 20,
+                    "completion_tokens": 15,
+                    "total_tokens": 35,
+                },
+            }
+        ).encode()
 
         # Configure mock to return the response directly
         mock_post.return_value = mock_response
@@ -183,33 +306,33 @@ class TestAsyncClient:
 
         # Verify request transformation
         call_args = mock_post.call_args
-        request_data = call_args[1]["json"]
+        request_data = json.loads(call_args[1]["content"])
         assert "tools" in request_data
         assert request_data["tools"][0]["function"]["name"] == "get_weather"
 
 
 class TestAsyncStreamingIntegration:
     @pytest.mark.asyncio
-    @patch("anthropic_openai_bridge.async_messages.httpx.AsyncClient.post")
-    async def test_async_streaming_tool_calls(self, mock_post):
+    @patch("anthropic_openai_bridge.async_messages.httpx.AsyncClient.send")
+    async def test_async_streaming_tool_calls(self, mock_send):
         # Mock async streaming response with tool calls
-        mock_response = Mock()
+        mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
 
-        async def mock_aiter_text():
+        async def mock_aiter_bytes():
             chunks = [
-                'data: {"id":"chatcmpl-123","choices":[{"delta":{"role":"assistant"}}]}\n\n',
-                'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":"Let me check that for you."}}]}\n\n',
-                'data: {"id":"chatcmpl-123","choices":[{"delta":{"tool_calls":[{"id":"call_123","function":{"name":"search","arguments":"{\\"query\\": \\"Python async\\"}"}}]}}]}\n\n',
-                'data: {"id":"chatcmpl-123","choices":[{"finish_reason":"tool_calls"}],"usage":{"prompt_tokens":25,"completion_tokens":20}}\n\n',
-                "data: [DONE]\n\n",
+                b'data: {"id":"chatcmpl-123","choices":[{"delta":{"role":"assistant"}}]}\n\n',
+                b'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":"Let me check that for you."}}]}\n\n',
+                b'data: {"id":"chatcmpl-123","choices":[{"delta":{"tool_calls":[{"id":"call_123","function":{"name":"search","arguments":"{\\"query\\": \\"Python async\\"}"}}]}}]}\n\n',
+                b'data: {"id":"chatcmpl-123","choices":[{"finish_reason":"tool_calls"}],"usage":{"prompt_tokens":25,"completion_tokens":20}}\n\n',
+                b"data: [DONE]\n\n",
             ]
             for chunk in chunks:
                 yield chunk
 
-        mock_response.aiter_text.return_value = mock_aiter_text()
+        mock_response.aiter_bytes.return_value = mock_aiter_bytes()
         # Configure mock to return the response directly
-        mock_post.return_value = mock_response
+        mock_send.return_value = mock_response
 
         client = AsyncAnthropicClient(api_key="test-key")
 
@@ -262,9 +385,9 @@ class TestAsyncStreamingIntegration:
 
         mock_response = Mock()
         mock_response.status_code = 401
-        mock_response.json.return_value = {
-            "error": {"message": "Invalid API key", "type": "invalid_request_error"}
-        }
+        mock_response.content = json.dumps(
+            {"error": {"message": "Invalid API key", "type": "invalid_request_error"}}
+        ).encode()
 
         # Configure mock to return the response directly
         mock_post.return_value = mock_response
@@ -282,7 +405,7 @@ class TestAsyncStreamingIntegration:
 
     @pytest.mark.asyncio
     async def test_async_context_manager_cleanup(self):
-        # Test that HTTP client is properly closed
+        # Test that a caller-supplied HTTP client is properly closed
         mock_http_client = Mock()
         mock_http_client.aclose = AsyncMock()
 
@@ -301,34 +424,55 @@ class TestAsyncPerformance:
         # Test multiple concurrent async requests
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "chatcmpl-123",
-            "choices": [{"message": {"content": "Response"}, "finish_reason": "stop"}],
-            "usage": {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8},
-        }
-
-        # Configure mock to return the response directly
-        mock_post.return_value = mock_response
+        mock_response.content = json.dumps(
+            {
+                "id": "chatcmpl-123",
+                "choices": [
+                    {"message": {"content": "Response"}, "finish_reason": "stop"}
+                ],
+                "usage": {
+                    "prompt_tokens": 5,
+                    "completion_tokens": 3,
+                    "total_tokens": 8,
+                },
+            }
+        ).encode()
+
+        # Track how many requests are in flight at once; yielding inside
+        # the fake transport lets other requests start before this returns
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_post(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return mock_response
+
+        mock_post.side_effect = fake_post
 
         client = AsyncAnthropicClient(api_key="test-key")
+        semaphore = asyncio.Semaphore(100)
 
-        # Create multiple concurrent requests
-        tasks = []
-        for i in range(5):
-            task = client.messages.create(
-                model="gpt-3.5-turbo",
-                max_tokens=100,
-                messages=[{"role": "user", "content": f"Request {i}"}],
-            )
-            tasks.append(task)
+        async def bounded_create(i):
+            async with semaphore:
+                return await client.messages.create(
+                    model="gpt-3.5-turbo",
+                    max_tokens=100,
+                    messages=[{"role": "user", "content": f"Request {i}"}],
+                )
 
         # Wait for all to complete
-        responses = await asyncio.gather(*tasks)
+        responses = await asyncio.gather(*(bounded_create(i) for i in range(1000)))
 
         # Verify all responses
-        assert len(responses) == 5
+        assert len(responses) == 1000
         for response in responses:
             assert response.content[0].text == "Response"
 
-        # Verify all requests were made
-        assert mock_post.call_count == 5
+        # Verify all requests were made, and concurrently rather than one
+        # at a time through some internal lock
+        assert mock_post.call_count == 1000
+        assert max_in_flight == 100
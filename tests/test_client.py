@@ -1,3 +1,4 @@
+import json
 from unittest.mock import Mock, patch
 
 import httpx
@@ -6,6 +7,8 @@ import pytest
 from anthropic_openai_bridge import AnthropicClient
 from anthropic_openai_bridge.exceptions import (AuthenticationError,
                                                 RateLimitError)
+from anthropic_openai_bridge.utils import (DEFAULT_CONNECTION_LIMITS,
+                                           HTTP2_AVAILABLE)
 
 
 class TestAnthropicClient:
@@ -20,27 +23,53 @@ class TestAnthropicClient:
         with AnthropicClient(api_key="test-key") as client:
             assert client is not None
 
+    def test_default_connection_limits(self):
+        with patch("httpx.HTTPTransport", wraps=httpx.HTTPTransport) as mock_transport:
+            client = AnthropicClient(api_key="test-key")
+
+        with client:
+            mock_transport.assert_any_call(
+                retries=2, limits=DEFAULT_CONNECTION_LIMITS, http2=HTTP2_AVAILABLE
+            )
+
+    def test_custom_connection_limits(self):
+        limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+        with patch("httpx.Client", wraps=httpx.Client) as mock_client:
+            client = AnthropicClient(
+                api_key="test-key", max_retries=0, limits=limits
+            )
+
+        with client:
+            assert mock_client.call_args.kwargs["limits"] == limits
+            assert mock_client.call_args.kwargs["http2"] is HTTP2_AVAILABLE
+
     @patch("anthropic_openai_bridge.messages.httpx.Client.post")
     def test_successful_message_creation(self, mock_post):
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "chatcmpl-123",
-            "object": "chat.completion",
-            "created": 1677652288,
-            "model": "gpt-3.5-turbo",
-            "choices": [
-                {
-                    "index": 0,
-                    "message": {
-                        "role": "assistant",
-                        "content": "Hello! How can I help you today?",
-                    },
-                    "finish_reason": "stop",
-                }
-            ],
-            "usage": {"prompt_tokens": 9, "completion_tokens": 12, "total_tokens": 21},
-        }
+        mock_response.content = json.dumps(
+            {
+                "id": "chatcmpl-123",
+                "object": "chat.completion",
+                "created": 1677652288,
+                "model": "gpt-3.5-turbo",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {
+                            "role": "assistant",
+                            "content": "Hello! How can I help you today?",
+                        },
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 9,
+                    "completion_tokens": 12,
+                    "total_tokens": 21,
+                },
+            }
+        ).encode()
         mock_post.return_value = mock_response
 
         client = AnthropicClient(api_key="test-key")
@@ -63,17 +92,21 @@ class TestAnthropicClient:
         assert response["content"][0]["text"] == "Hello! How can I help you today?"
 
         mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert call_args[1]["json"]["model"] == "claude-3-sonnet-20240229"
-        assert call_args[1]["json"]["max_tokens"] == 1000
+        assert mock_post.call_args[0][0] == "https://api.openai.com/v1/chat/completions"
+        request_headers = mock_post.call_args[1]["headers"]
+        assert request_headers["Authorization"] == "Bearer test-key"
+        assert request_headers["Content-Type"] == "application/json"
+        request_data = json.loads(mock_post.call_args[1]["content"])
+        assert request_data["model"] == "claude-3-sonnet-20240229"
+        assert request_data["max_tokens"] == 1000
 
     @patch("anthropic_openai_bridge.messages.httpx.Client.post")
     def test_authentication_error(self, mock_post):
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 401
-        mock_response.json.return_value = {
-            "error": {"message": "Invalid API key", "type": "invalid_request_error"}
-        }
+        mock_response.content = json.dumps(
+            {"error": {"message": "Invalid API key", "type": "invalid_request_error"}}
+        ).encode()
         mock_post.return_value = mock_response
 
         client = AnthropicClient(api_key="invalid-key")
@@ -91,9 +124,9 @@ class TestAnthropicClient:
     def test_rate_limit_error(self, mock_post):
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 429
-        mock_response.json.return_value = {
-            "error": {"message": "Rate limit exceeded", "type": "rate_limit_error"}
-        }
+        mock_response.content = json.dumps(
+            {"error": {"message": "Rate limit exceeded", "type": "rate_limit_error"}}
+        ).encode()
         mock_post.return_value = mock_response
 
         client = AnthropicClient(api_key="test-key")
@@ -107,16 +140,17 @@ class TestAnthropicClient:
 
         assert "Rate limit exceeded" in str(exc_info.value)
 
+    @patch("anthropic_openai_bridge.messages.httpx.Client.send")
     @patch("anthropic_openai_bridge.messages.httpx.Client.post")
-    def test_streaming_and_tools_supported(self, mock_post):
+    def test_streaming_and_tools_supported(self, mock_post, mock_send):
         # Test that streaming and tools are now supported (no NotImplementedError)
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.iter_text.return_value = [
-            'data: {"choices":[{"delta":{"content":"Hello"}}]}\n\n',
-            "data: [DONE]\n\n",
+        mock_response.iter_bytes.return_value = [
+            b'data: {"choices":[{"delta":{"content":"Hello"}}]}\n\n',
+            b"data: [DONE]\n\n",
         ]
-        mock_post.return_value = mock_response
+        mock_send.return_value = mock_response
 
         client = AnthropicClient(api_key="test-key")
 
@@ -134,33 +168,39 @@ class TestAnthropicClient:
             pytest.fail("Streaming should be implemented in Phase 2")
 
         # Reset mock for tools test
-        mock_response.json.return_value = {
-            "id": "chatcmpl-123",
-            "object": "chat.completion",
-            "created": 1677652288,
-            "model": "gpt-3.5-turbo",
-            "choices": [
-                {
-                    "index": 0,
-                    "message": {
-                        "role": "assistant",
-                        "content": None,
-                        "tool_calls": [
-                            {
-                                "id": "call_123",
-                                "type": "function",
-                                "function": {
-                                    "name": "test_tool",
-                                    "arguments": '{"arg": "value"}',
-                                },
-                            }
-                        ],
-                    },
-                    "finish_reason": "tool_calls",
-                }
-            ],
-            "usage": {"prompt_tokens": 9, "completion_tokens": 12, "total_tokens": 21},
-        }
+        mock_response.content = json.dumps(
+            {
+                "id": "chatcmpl-123",
+                "object": "chat.completion",
+                "created": 1677652288,
+                "model": "gpt-3.5-turbo",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {
+                            "role": "assistant",
+                            "content": None,
+                            "tool_calls": [
+                                {
+                                    "id": "call_123",
+                                    "type": "function",
+                                    "function": {
+                                        "name": "test_tool",
+                                        "arguments": '{"arg": "value"}',
+                                    },
+                                }
+                            ],
+                        },
+                        "finish_reason": "tool_calls",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 9,
+                    "completion_tokens": 12,
+                    "total_tokens": 21,
+                },
+            }
+        ).encode()
         mock_post.return_value = mock_response
 
         # Test tools - should not raise NotImplementedError
@@ -8,11 +8,20 @@ from unittest.mock import Mock, patch
 import httpx
 import pytest
 
-from anthropic_openai_bridge.exceptions import APIError, AuthenticationError
+from anthropic_openai_bridge.exceptions import (APIError, AuthenticationError,
+                                                InternalServerError, RateLimitError)
 from anthropic_openai_bridge.messages import Messages
 from anthropic_openai_bridge.async_messages import AsyncMessages
 from anthropic_openai_bridge.transformers.request import _transform_content_blocks
 from anthropic_openai_bridge.transformers.response import transform_openai_to_anthropic
+from anthropic_openai_bridge.utils import (DEFAULT_CONNECTION_LIMITS,
+                                           HTTP2_AVAILABLE,
+                                           AsyncRetryTransport)
+
+# Single SSE text-delta frame, encoded once at import
+_SSE_CHUNK = (
+    "data: " + json.dumps({"choices": [{"delta": {"content": "Hello"}}]}) + "\n\n"
+).encode()
 
 
 class TestRequestTransformerEdgeCases:
@@ -115,7 +124,9 @@ class TestMessagesErrorHandling:
         mock_client = Mock(spec=httpx.Client)
         mock_response = Mock()
         mock_response.status_code = 401
-        mock_response.json.return_value = {"error": {"message": "Invalid API key"}}
+        mock_response.content = json.dumps(
+            {"error": {"message": "Invalid API key"}}
+        ).encode()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "401 Unauthorized", request=Mock(), response=mock_response
         )
@@ -168,7 +179,9 @@ class TestAsyncMessagesErrorHandling:
         mock_client = Mock(spec=httpx.AsyncClient)
         mock_response = Mock()
         mock_response.status_code = 429
-        mock_response.json.return_value = {"error": {"message": "Rate limit exceeded"}}
+        mock_response.content = json.dumps(
+            {"error": {"message": "Rate limit exceeded"}}
+        ).encode()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "429 Too Many Requests", request=Mock(), response=mock_response
         )
@@ -183,6 +196,34 @@ class TestAsyncMessagesErrorHandling:
                 messages=[{"role": "user", "content": "Hello"}]
             )
 
+    @pytest.mark.asyncio
+    async def test_async_messages_rate_limit_retried_before_raising(self):
+        """Test 429s are retried by the transport before RateLimitError."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(
+                429, json={"error": {"message": "Rate limit exceeded"}}
+            )
+
+        transport = AsyncRetryTransport(
+            httpx.MockTransport(handler), max_retries=2, backoff_factor=0
+        )
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            async_messages = AsyncMessages(
+                "test_key", "https://api.example.com", http_client
+            )
+
+            with pytest.raises(RateLimitError, match="Rate limit exceeded"):
+                await async_messages.create(
+                    model="gpt-3.5-turbo",
+                    max_tokens=100,
+                    messages=[{"role": "user", "content": "Hello"}]
+                )
+
+        assert len(calls) == 3
+
     @pytest.mark.asyncio
     async def test_async_messages_network_timeout(self):
         """Test AsyncMessages handling of network timeouts."""
@@ -202,17 +243,19 @@ class TestAsyncMessagesErrorHandling:
     async def test_async_messages_stream_error_handling(self):
         """Test AsyncMessages stream error handling."""
         mock_client = Mock(spec=httpx.AsyncClient)
-        mock_response = Mock()
+        mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 500
-        mock_response.json.return_value = {"error": {"message": "Internal server error"}}
+        mock_response.content = json.dumps(
+            {"error": {"message": "Internal server error"}}
+        ).encode()
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "500 Internal Server Error", request=Mock(), response=mock_response
         )
-        mock_client.post.return_value = mock_response
+        mock_client.send.return_value = mock_response
 
         async_messages = AsyncMessages("test_key", "https://api.example.com", mock_client)
 
-        with pytest.raises(APIError):
+        with pytest.raises(InternalServerError, match="Internal server error"):
             async for _ in await async_messages.create(
                 model="gpt-3.5-turbo",
                 max_tokens=100,
@@ -221,6 +264,35 @@ class TestAsyncMessagesErrorHandling:
             ):
                 pass
 
+        # The error body is read from the unread stream, then released
+        mock_response.aread.assert_awaited_once()
+        mock_response.aclose.assert_awaited_once()
+
+
+class TestMessagesDefaultHttpClient:
+    """Test the HTTP clients Messages/AsyncMessages build when none is given."""
+
+    def test_messages_default_client_pool_limits(self):
+        """Test Messages builds a pooled client with the bridge's limits."""
+        with patch("httpx.Client", wraps=httpx.Client) as mock_client:
+            messages = Messages("test_key", "https://api.example.com")
+
+        mock_client.assert_called_once_with(
+            timeout=60.0, limits=DEFAULT_CONNECTION_LIMITS, http2=HTTP2_AVAILABLE
+        )
+        messages.http_client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_messages_default_client_pool_limits(self):
+        """Test AsyncMessages builds a pooled client with the bridge's limits."""
+        with patch("httpx.AsyncClient", wraps=httpx.AsyncClient) as mock_client:
+            async_messages = AsyncMessages("test_key", "https://api.example.com")
+
+        mock_client.assert_called_once_with(
+            timeout=60.0, limits=DEFAULT_CONNECTION_LIMITS, http2=HTTP2_AVAILABLE
+        )
+        await async_messages.http_client.aclose()
+
 
 class TestStreamingEdgeCases:
     """Test streaming edge cases."""
@@ -250,12 +322,12 @@ class TestStreamingEdgeCases:
         from anthropic_openai_bridge.streaming import parse_openai_streaming_response_async
         
         # Mock a stream that raises an exception mid-stream  
-        async def mock_text_stream():
-            yield "data: " + json.dumps({"choices": [{"delta": {"content": "Hello"}}]}) + "\n\n"
+        async def mock_byte_stream():
+            yield _SSE_CHUNK
             raise httpx.ReadError("Connection lost")
         
         mock_response = Mock()
-        mock_response.aiter_text.return_value = mock_text_stream()
+        mock_response.aiter_bytes.return_value = mock_byte_stream()
         
         events = []
         try:
@@ -276,10 +348,10 @@ class TestParameterValidation:
         mock_client = Mock(spec=httpx.Client)
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "choices": [{"message": {"content": "Hello"}, "finish_reason": "stop"}],
             "usage": {"prompt_tokens": 10, "completion_tokens": 5}
-        }
+        }).encode()
         mock_client.post.return_value = mock_response
 
         messages = Messages("test_key", "https://api.example.com", mock_client)
@@ -300,10 +372,10 @@ class TestParameterValidation:
         mock_client = Mock(spec=httpx.Client)
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "choices": [{"message": {"content": "Hello"}, "finish_reason": "stop"}],
             "usage": {"prompt_tokens": 10, "completion_tokens": 5}
-        }
+        }).encode()
         mock_client.post.return_value = mock_response
 
         messages = Messages("test_key", "https://api.example.com", mock_client)
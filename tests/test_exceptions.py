@@ -2,6 +2,8 @@
 Tests for exceptions module.
 """
 
+import pickle
+
 import pytest
 from unittest.mock import Mock
 
@@ -35,6 +37,17 @@ class TestExceptionClasses:
         assert str(error) == "Test error"
         assert error.response == mock_response
 
+    def test_api_error_attributes_in_slots(self):
+        """Test request/response are slot attributes that survive pickling."""
+        error = RateLimitError("Slow down", response="response")
+        assert error.__dict__ == {}
+
+        restored = pickle.loads(pickle.dumps(error))
+        assert type(restored) is RateLimitError
+        assert str(restored) == "Slow down"
+        assert restored.request is None
+        assert restored.response == "response"
+
     def test_authentication_error(self):
         """Test AuthenticationError construction."""
         error = AuthenticationError("Invalid API key")
@@ -87,87 +100,34 @@ class TestExceptionClasses:
 class TestMapOpenAIErrorToAnthropic:
     """Test the error mapping function."""
 
-    def test_map_401_to_authentication_error(self):
-        """Test mapping 401 status code to AuthenticationError."""
-        error_data = {"error": {"message": "Incorrect API key"}}
-        
-        error = map_openai_error_to_anthropic(401, error_data)
-        
-        assert isinstance(error, AuthenticationError)
-        assert "Incorrect API key" in str(error)
-
-    def test_map_400_to_bad_request_error(self):
-        """Test mapping 400 status code to BadRequestError."""
-        error_data = {"error": {"message": "Invalid request"}}
-        
-        error = map_openai_error_to_anthropic(400, error_data)
-        
-        assert isinstance(error, BadRequestError)
-        assert "Invalid request" in str(error)
-
-    def test_map_403_to_permission_denied_error(self):
-        """Test mapping 403 status code to PermissionDeniedError."""
-        error_data = {"error": {"message": "Forbidden"}}
-        
-        error = map_openai_error_to_anthropic(403, error_data)
-        
-        assert isinstance(error, PermissionDeniedError)
-        assert "Forbidden" in str(error)
-
-    def test_map_404_to_not_found_error(self):
-        """Test mapping 404 status code to NotFoundError."""
-        error_data = {"error": {"message": "Not found"}}
-        
-        error = map_openai_error_to_anthropic(404, error_data)
-        
-        assert isinstance(error, NotFoundError)
-        assert "Not found" in str(error)
-
-    def test_map_409_to_conflict_error(self):
-        """Test mapping 409 status code to ConflictError."""
-        error_data = {"error": {"message": "Conflict"}}
-        
-        error = map_openai_error_to_anthropic(409, error_data)
-        
-        assert isinstance(error, ConflictError)
-        assert "Conflict" in str(error)
-
-    def test_map_422_to_unprocessable_entity_error(self):
-        """Test mapping 422 status code to UnprocessableEntityError."""
-        error_data = {"error": {"message": "Validation failed"}}
-        
-        error = map_openai_error_to_anthropic(422, error_data)
-        
-        assert isinstance(error, UnprocessableEntityError)
-        assert "Validation failed" in str(error)
-
-    def test_map_429_to_rate_limit_error(self):
-        """Test mapping 429 status code to RateLimitError."""
-        error_data = {"error": {"message": "Rate limit exceeded"}}
-        
-        error = map_openai_error_to_anthropic(429, error_data)
-        
-        assert isinstance(error, RateLimitError)
-        assert "Rate limit exceeded" in str(error)
-
-    def test_map_500_to_internal_server_error(self):
-        """Test mapping 500 status code to InternalServerError."""
-        error_data = {"error": {"message": "Internal server error"}}
-        
-        error = map_openai_error_to_anthropic(500, error_data)
-        
-        assert isinstance(error, InternalServerError)
-        assert "Internal server error" in str(error)
-
-    def test_map_unknown_status_to_api_error(self):
-        """Test mapping unknown status code to generic APIError."""
-        error_data = {"error": {"message": "I'm a teapot"}}
-        
-        error = map_openai_error_to_anthropic(418, error_data)
-        
-        assert isinstance(error, APIError)
-        assert not isinstance(error, (AuthenticationError, BadRequestError))
-        assert "I'm a teapot" in str(error)
+    @pytest.mark.parametrize(
+        "status_code,error_class,message",
+        [
+            (400, BadRequestError, "Invalid request"),
+            (401, AuthenticationError, "Incorrect API key"),
+            (403, PermissionDeniedError, "Forbidden"),
+            (404, NotFoundError, "Not found"),
+            (409, ConflictError, "Conflict"),
+            (422, UnprocessableEntityError, "Validation failed"),
+            (429, RateLimitError, "Rate limit exceeded"),
+            (500, InternalServerError, "Internal server error"),
+            (418, APIError, "I'm a teapot"),
+        ],
+    )
+    def test_map_status_to_exception(self, status_code, error_class, message):
+        """Test mapping each status code to its exception class."""
+        error_data = {"error": {"message": message}}
+
+        error = map_openai_error_to_anthropic(status_code, error_data)
+
+        assert type(error) is error_class
+        assert message in str(error)
+
+    def test_map_other_5xx_to_internal_server_error(self):
+        """Test that any 5xx status maps to InternalServerError."""
+        for status_code in (502, 503, 504):
+            error = map_openai_error_to_anthropic(status_code)
+            assert type(error) is InternalServerError
 
     def test_map_error_without_error_data(self):
         """Test mapping error when no error data is provided."""
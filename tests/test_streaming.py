@@ -1,13 +1,16 @@
+import copy
 from unittest.mock import Mock, patch
 
 import httpx
 import pytest
 
 from anthropic_openai_bridge import AnthropicClient
+from anthropic_openai_bridge.exceptions import APIError
+from anthropic_openai_bridge.messages import Messages
 from anthropic_openai_bridge.streaming import (
     SSEParser, parse_openai_streaming_response,
     transform_openai_stream_to_anthropic)
-from anthropic_openai_bridge.types import (ContentBlockDelta,
+from anthropic_openai_bridge.types import (ContentBlock, ContentBlockDelta,
                                            ContentBlockStart, ContentBlockStop,
                                            MessageDelta, MessageStart,
                                            MessageStop)
@@ -40,26 +43,88 @@ data: {"id": "msg_123", "type": "message"}"""
         assert result["data"]["id"] == "msg_123"
         assert result["data"]["type"] == "message"
 
+    def test_parse_event_data_without_space(self):
+        event_data = 'id: 7\ndata:{"id": "msg_123"}'
+
+        result = SSEParser.parse_event(event_data)
+        assert result["id"] == "7"
+        assert result["data"] == {"id": "msg_123"}
+
+    def test_parse_event_multiline_data(self):
+        event_data = 'data: {"id":\ndata: "msg_123"}'
+
+        result = SSEParser.parse_event(event_data)
+        assert result["data"] == {"id": "msg_123"}
+
     def test_parse_done_event(self):
         event_data = "data: [DONE]"
         result = SSEParser.parse_event(event_data)
         assert result["event"] == "done"
 
+    def test_parse_streaming_response_lines(self):
+        mock_response = Mock(spec=httpx.Response)
+        mock_response.iter_bytes.return_value = [
+            b": keep-alive\n\n",
+            b'data: {"id": "1"}\n\n',
+            b'data: {"id": "2"}\n\n',
+            b"data: [DONE]\n\n",
+            b'data: {"id": "3"}\n\n',
+        ]
+
+        events = list(parse_openai_streaming_response(mock_response))
+
+        assert events == [{"id": "1"}, {"id": "2"}]
+
+    def test_parse_streaming_response_frames_split_across_chunks(self):
+        payload = 'data: {"text": "café"}\n\ndata: {"id": "2"}\r\n\r\n'.encode()
+        mock_response = Mock(spec=httpx.Response)
+        # Split inside the multi-byte character and between CR and LF
+        cut = payload.index("é".encode()) + 1
+        mock_response.iter_bytes.return_value = [
+            payload[:cut],
+            payload[cut:-3],
+            payload[-3:],
+        ]
+
+        events = list(parse_openai_streaming_response(mock_response))
+
+        assert events == [{"text": "café"}, {"id": "2"}]
+
+    def test_parse_streaming_response_one_byte_chunks(self):
+        payload = b'data: {"id": "1"}\r\n\r\ndata: {"id": "2"}\n\ndata: [DONE]\r\n\r\n'
+        mock_response = Mock(spec=httpx.Response)
+        # Every frame boundary, including each CR/LF pair, lands across chunks
+        mock_response.iter_bytes.return_value = [
+            payload[i : i + 1] for i in range(len(payload))
+        ]
+
+        events = list(parse_openai_streaming_response(mock_response))
+
+        assert events == [{"id": "1"}, {"id": "2"}]
+
+    def test_parse_streaming_response_without_trailing_blank_line(self):
+        mock_response = Mock(spec=httpx.Response)
+        mock_response.iter_bytes.return_value = [b'data: {"id": "1"}']
+
+        events = list(parse_openai_streaming_response(mock_response))
+
+        assert events == [{"id": "1"}]
+
 
 class TestStreamingResponse:
-    @patch("anthropic_openai_bridge.messages.httpx.Client.post")
-    def test_streaming_text_response(self, mock_post):
+    @patch("anthropic_openai_bridge.messages.httpx.Client.send")
+    def test_streaming_text_response(self, mock_send):
         # Mock streaming response
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.iter_text.return_value = [
-            'data: {"id":"chatcmpl-123","choices":[{"delta":{"role":"assistant"}}]}\n\n',
-            'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":"Hello"}}]}\n\n',
-            'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":" world"}}]}\n\n',
-            'data: {"id":"chatcmpl-123","choices":[{"finish_reason":"stop"}],"usage":{"prompt_tokens":10,"completion_tokens":5}}\n\n',
-            "data: [DONE]\n\n",
+        mock_response.iter_bytes.return_value = [
+            b'data: {"id":"chatcmpl-123","choices":[{"delta":{"role":"assistant"}}]}\n\n',
+            b'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":"Hello"}}]}\n\n',
+            b'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":" world"}}]}\n\n',
+            b'data: {"id":"chatcmpl-123","choices":[{"finish_reason":"stop"}],"usage":{"prompt_tokens":10,"completion_tokens":5}}\n\n',
+            b"data: [DONE]\n\n",
         ]
-        mock_post.return_value = mock_response
+        mock_send.return_value = mock_response
 
         client = AnthropicClient(api_key="test-key")
 
@@ -102,18 +167,73 @@ class TestStreamingResponse:
         assert content_block_stop_found
         assert message_stop_found
 
-    @patch("anthropic_openai_bridge.messages.httpx.Client.post")
-    def test_streaming_tool_response(self, mock_post):
+    def test_streaming_reads_body_incrementally(self):
+        frames = [
+            b'data: {"id":"chatcmpl-123","choices":[{"delta":{"role":"assistant"}}]}\n\n',
+            b'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":"Hi"}}]}\n\n',
+            b'data: {"id":"chatcmpl-123","choices":[{"finish_reason":"stop"}]}\n\n',
+            b"data: [DONE]\n\n",
+        ]
+        sent = []
+
+        def body():
+            for frame in frames:
+                sent.append(frame)
+                yield frame
+
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=body())
+        )
+        with httpx.Client(transport=transport) as http_client:
+            messages = Messages("test-key", "https://api.example.com", http_client)
+            stream = messages.create(
+                model="gpt-3.5-turbo",
+                max_tokens=1000,
+                messages=[{"role": "user", "content": "Hello"}],
+                stream=True,
+            )
+
+            # Only the first frame has been pulled off the wire
+            assert isinstance(next(stream), MessageStart)
+            assert len(sent) == 1
+
+            events = list(stream)
+
+        assert isinstance(events[-1], MessageStop)
+        assert len(sent) == len(frames)
+
+    def test_streaming_network_error_maps_to_api_error(self):
+        def body():
+            yield b'data: {"id":"x","choices":[{"delta":{"role":"assistant"}}]}\n\n'
+            raise httpx.ReadError("Connection lost")
+
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=body())
+        )
+        with httpx.Client(transport=transport) as http_client:
+            messages = Messages("test-key", "https://api.example.com", http_client)
+            stream = messages.create(
+                model="gpt-3.5-turbo",
+                max_tokens=1000,
+                messages=[{"role": "user", "content": "Hello"}],
+                stream=True,
+            )
+
+            with pytest.raises(APIError, match="Connection lost"):
+                list(stream)
+
+    @patch("anthropic_openai_bridge.messages.httpx.Client.send")
+    def test_streaming_tool_response(self, mock_send):
         # Mock streaming response with tool calls
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.iter_text.return_value = [
-            'data: {"id":"chatcmpl-123","choices":[{"delta":{"role":"assistant"}}]}\n\n',
-            'data: {"id":"chatcmpl-123","choices":[{"delta":{"tool_calls":[{"id":"call_123","function":{"name":"get_weather","arguments":"{\\"location\\": \\"San Francisco\\"}"}}]}}]}\n\n',
-            'data: {"id":"chatcmpl-123","choices":[{"finish_reason":"tool_calls"}],"usage":{"prompt_tokens":15,"completion_tokens":10}}\n\n',
-            "data: [DONE]\n\n",
+        mock_response.iter_bytes.return_value = [
+            b'data: {"id":"chatcmpl-123","choices":[{"delta":{"role":"assistant"}}]}\n\n',
+            b'data: {"id":"chatcmpl-123","choices":[{"delta":{"tool_calls":[{"id":"call_123","function":{"name":"get_weather","arguments":"{\\"location\\": \\"San Francisco\\"}"}}]}}]}\n\n',
+            b'data: {"id":"chatcmpl-123","choices":[{"finish_reason":"tool_calls"}],"usage":{"prompt_tokens":15,"completion_tokens":10}}\n\n',
+            b"data: [DONE]\n\n",
         ]
-        mock_post.return_value = mock_response
+        mock_send.return_value = mock_response
 
         client = AnthropicClient(api_key="test-key")
 
@@ -187,6 +307,40 @@ class TestStreamingTransformation:
         assert isinstance(anthropic_events[3], ContentBlockDelta)
         assert anthropic_events[3].delta["text"] == " world"
 
+    def test_transform_accumulates_text_on_message(self):
+        openai_events = [
+            {"id": "chatcmpl-123", "choices": [{"delta": {"role": "assistant"}}]},
+            {"id": "chatcmpl-123", "choices": [{"delta": {"content": "Hello"}}]},
+            {"id": "chatcmpl-123", "choices": [{"delta": {"content": " world"}}]},
+        ]
+
+        # With and without a closing finish_reason chunk
+        for tail in ([{"choices": [{"finish_reason": "stop"}]}], []):
+            anthropic_events = list(
+                transform_openai_stream_to_anthropic(iter(openai_events + tail))
+            )
+
+            message = anthropic_events[0].message
+            assert message.content[0].text == "Hello world"
+
+    def test_transform_text_readable_mid_stream(self):
+        openai_events = [
+            {"id": "chatcmpl-123", "choices": [{"delta": {"role": "assistant"}}]},
+            {"id": "chatcmpl-123", "choices": [{"delta": {"content": "Hello"}}]},
+            {"id": "chatcmpl-123", "choices": [{"delta": {"content": " world"}}]},
+        ]
+
+        seen = []
+        for event in transform_openai_stream_to_anthropic(iter(openai_events)):
+            if isinstance(event, ContentBlockStart):
+                block = event.content_block
+            if isinstance(event, ContentBlockDelta):
+                seen.append((block.text, block["text"]))
+
+        assert seen == [("Hello", "Hello"), ("Hello world", "Hello world")]
+        assert isinstance(block, ContentBlock)
+        assert copy.copy(block).text == "Hello world"
+
     def test_transform_finish_reasons(self):
         test_cases = [
             ("stop", "end_turn"),
@@ -220,23 +374,131 @@ class TestStreamingTransformation:
             assert message_delta is not None
             assert message_delta.delta["stop_reason"] == expected_anthropic_reason
 
+    def test_transform_tool_call_arguments_across_chunks(self):
+        openai_events = [
+            {"id": "test", "choices": [{"delta": {"role": "assistant"}}]},
+            {"id": "test", "choices": [{"delta": {"content": "Checking."}}]},
+            {
+                "id": "test",
+                "choices": [
+                    {
+                        "delta": {
+                            "tool_calls": [
+                                {
+                                    "index": 0,
+                                    "id": "call_1",
+                                    "function": {"name": "get_weather", "arguments": ""},
+                                }
+                            ]
+                        }
+                    }
+                ],
+            },
+            {
+                "id": "test",
+                "choices": [
+                    {
+                        "delta": {
+                            "tool_calls": [
+                                {"index": 0, "function": {"arguments": '{"loca'}}
+                            ]
+                        }
+                    }
+                ],
+            },
+            {
+                "id": "test",
+                "choices": [
+                    {
+                        "delta": {
+                            "tool_calls": [
+                                {"index": 0, "function": {"arguments": 'tion": "SF"}'}}
+                            ]
+                        }
+                    }
+                ],
+            },
+            {"id": "test", "choices": [{"finish_reason": "tool_calls"}]},
+        ]
+
+        anthropic_events = list(
+            transform_openai_stream_to_anthropic(iter(openai_events))
+        )
+
+        starts = [e for e in anthropic_events if isinstance(e, ContentBlockStart)]
+        assert [s.index for s in starts] == [0, 1]
+        assert starts[1].content_block.name == "get_weather"
+        assert starts[1].content_block.input == {"location": "SF"}
+
+        input_deltas = [
+            e
+            for e in anthropic_events
+            if isinstance(e, ContentBlockDelta) and "input" in e.delta
+        ]
+        assert len(input_deltas) == 1
+        assert input_deltas[0].index == 1
+        assert input_deltas[0].delta["input"] == {"location": "SF"}
+
+        stops = [e for e in anthropic_events if isinstance(e, ContentBlockStop)]
+        assert [s.index for s in stops] == [0, 1]
+
+    def test_transform_ignores_null_fields_without_errors(self, caplog):
+        openai_events = [
+            {"id": "test", "choices": [{"delta": {"role": "assistant"}}]},
+            {
+                "id": "test",
+                "choices": [{"delta": {"content": "Hi", "tool_calls": None}}],
+            },
+            {"id": "test", "choices": [{"delta": None, "finish_reason": "stop"}]},
+            {"id": "test", "choices": [], "usage": {"prompt_tokens": 1}},
+        ]
+
+        with caplog.at_level("ERROR"):
+            anthropic_events = list(
+                transform_openai_stream_to_anthropic(iter(openai_events))
+            )
+
+        assert not caplog.records
+        assert isinstance(anthropic_events[-1], MessageStop)
+
+    def test_transform_skips_malformed_event(self):
+        openai_events = [
+            {"id": "test", "choices": [{"delta": {"role": "assistant"}}]},
+            {"id": "test", "choices": []},
+            {"id": "test", "choices": [{"delta": {"content": "Hi"}}]},
+            {"id": "test", "choices": [{"finish_reason": "stop"}]},
+        ]
+
+        anthropic_events = list(
+            transform_openai_stream_to_anthropic(iter(openai_events))
+        )
+
+        assert [type(e) for e in anthropic_events] == [
+            MessageStart,
+            ContentBlockStart,
+            ContentBlockDelta,
+            ContentBlockStop,
+            MessageDelta,
+            MessageStop,
+        ]
+
 
 class TestStreamingIntegration:
-    @patch("anthropic_openai_bridge.messages.httpx.Client.post")
-    def test_end_to_end_streaming(self, mock_post):
+    @patch("anthropic_openai_bridge.messages.httpx.Client.send")
+    def test_end_to_end_streaming(self, mock_send):
         # Test complete streaming workflow
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.iter_text.return_value = [
-            'data: {"id":"chatcmpl-123","model":"gpt-3.5-turbo","choices":[{"delta":{"role":"assistant"}}]}\n\n',
-            'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":"The"}}]}\n\n',
-            'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":" weather"}}]}\n\n',
-            'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":" is"}}]}\n\n',
-            'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":" sunny."}}]}\n\n',
-            'data: {"id":"chatcmpl-123","choices":[{"finish_reason":"stop"}],"usage":{"prompt_tokens":20,"completion_tokens":8}}\n\n',
-            "data: [DONE]\n\n",
+        mock_response.iter_bytes.return_value = [
+            b'data: {"id":"chatcmpl-123","model":"gpt-3.5-turbo","choices":[{"delta":{"role":"assistant"}}]}\n\n',
+            b'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":"The"}}]}\n\n',
+            b'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":" weather"}}]}\n\n',
+            b'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":" is"}}]}\n\n',
+            b'data: {"id":"chatcmpl-123","choices":[{"delta":{"content":" sunny."}}]}\n\n',
+            b'data: {"id":"chatcmpl-123","choices":[{"finish_reason":"stop"}],"usage":{"prompt_tokens":20,"completion_tokens":8}}\n\n',
+            b"data: [DONE]\n\n",
         ]
-        mock_post.return_value = mock_response
+        mock_send.return_value = mock_response
 
         client = AnthropicClient(api_key="test-key")
 
@@ -201,29 +201,35 @@ class TestToolIntegration:
         # Mock successful tool call response
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "chatcmpl-123",
-            "choices": [
-                {
-                    "message": {
-                        "role": "assistant",
-                        "content": None,
-                        "tool_calls": [
-                            {
-                                "id": "call_123",
-                                "type": "function",
-                                "function": {
-                                    "name": "get_weather",
-                                    "arguments": '{"location": "Boston"}',
-                                },
-                            }
-                        ],
-                    },
-                    "finish_reason": "tool_calls",
-                }
-            ],
-            "usage": {"prompt_tokens": 20, "completion_tokens": 10, "total_tokens": 30},
-        }
+        mock_response.content = json.dumps(
+            {
+                "id": "chatcmpl-123",
+                "choices": [
+                    {
+                        "message": {
+                            "role": "assistant",
+                            "content": None,
+                            "tool_calls": [
+                                {
+                                    "id": "call_123",
+                                    "type": "function",
+                                    "function": {
+                                        "name": "get_weather",
+                                        "arguments": '{"location": "Boston"}',
+                                    },
+                                }
+                            ],
+                        },
+                        "finish_reason": "tool_calls",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 20,
+                    "completion_tokens": 10,
+                    "total_tokens": 30,
+                },
+            }
+        ).encode()
         mock_post.return_value = mock_response
 
         client = AnthropicClient(api_key="test-key")
@@ -249,7 +255,7 @@ class TestToolIntegration:
         # Verify the request was transformed correctly
         mock_post.assert_called_once()
         call_args = mock_post.call_args
-        request_data = call_args[1]["json"]
+        request_data = json.loads(call_args[1]["content"])
 
         # Check that tools were transformed to OpenAI format
         assert "tools" in request_data
@@ -273,46 +279,58 @@ class TestToolIntegration:
         # First response: assistant makes tool call
         mock_response_1 = Mock(spec=httpx.Response)
         mock_response_1.status_code = 200
-        mock_response_1.json.return_value = {
-            "id": "chatcmpl-123",
-            "choices": [
-                {
-                    "message": {
-                        "role": "assistant",
-                        "content": "I'll check the weather for you.",
-                        "tool_calls": [
-                            {
-                                "id": "call_123",
-                                "type": "function",
-                                "function": {
-                                    "name": "get_weather",
-                                    "arguments": '{"location": "Paris"}',
-                                },
-                            }
-                        ],
-                    },
-                    "finish_reason": "tool_calls",
-                }
-            ],
-            "usage": {"prompt_tokens": 15, "completion_tokens": 20, "total_tokens": 35},
-        }
+        mock_response_1.content = json.dumps(
+            {
+                "id": "chatcmpl-123",
+                "choices": [
+                    {
+                        "message": {
+                            "role": "assistant",
+                            "content": "I'll check the weather for you.",
+                            "tool_calls": [
+                                {
+                                    "id": "call_123",
+                                    "type": "function",
+                                    "function": {
+                                        "name": "get_weather",
+                                        "arguments": '{"location": "Paris"}',
+                                    },
+                                }
+                            ],
+                        },
+                        "finish_reason": "tool_calls",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 15,
+                    "completion_tokens": 20,
+                    "total_tokens": 35,
+                },
+            }
+        ).encode()
 
         # Second response: assistant responds with weather info
         mock_response_2 = Mock(spec=httpx.Response)
         mock_response_2.status_code = 200
-        mock_response_2.json.return_value = {
-            "id": "chatcmpl-456",
-            "choices": [
-                {
-                    "message": {
-                        "role": "assistant",
-                        "content": "The weather in Paris is sunny with 25°C.",
-                    },
-                    "finish_reason": "stop",
-                }
-            ],
-            "usage": {"prompt_tokens": 30, "completion_tokens": 12, "total_tokens": 42},
-        }
+        mock_response_2.content = json.dumps(
+            {
+                "id": "chatcmpl-456",
+                "choices": [
+                    {
+                        "message": {
+                            "role": "assistant",
+                            "content": "The weather in Paris is sunny with 25°C.",
+                        },
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 30,
+                    "completion_tokens": 12,
+                    "total_tokens": 42,
+                },
+            }
+        ).encode()
 
         mock_post.side_effect = [mock_response_1, mock_response_2]
 
@@ -376,7 +394,7 @@ class TestToolIntegration:
         # Verify the conversation was transformed correctly in the request
         assert mock_post.call_count == 2
         second_call_args = mock_post.call_args_list[1]
-        request_messages = second_call_args[1]["json"]["messages"]
+        request_messages = json.loads(second_call_args[1]["content"])["messages"]
 
         # Should have: user, assistant (with tool_calls), tool (result), assistant
         assert len(request_messages) >= 3
@@ -398,11 +416,17 @@ class TestToolIntegration:
         # Test different tool_choice values
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "test",
-            "choices": [{"message": {"content": "test"}, "finish_reason": "stop"}],
-            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
-        }
+        mock_response.content = json.dumps(
+            {
+                "id": "test",
+                "choices": [{"message": {"content": "test"}, "finish_reason": "stop"}],
+                "usage": {
+                    "prompt_tokens": 1,
+                    "completion_tokens": 1,
+                    "total_tokens": 2,
+                },
+            }
+        ).encode()
         mock_post.return_value = mock_response
 
         client = AnthropicClient(api_key="test-key")
@@ -423,7 +447,7 @@ class TestToolIntegration:
             tool_choice="auto",
         )
 
-        request_data = mock_post.call_args[1]["json"]
+        request_data = json.loads(mock_post.call_args[1]["content"])
         assert request_data["tool_choice"] == "auto"
 
         # Test required choice
@@ -435,7 +459,7 @@ class TestToolIntegration:
             tool_choice="required",
         )
 
-        request_data = mock_post.call_args[1]["json"]
+        request_data = json.loads(mock_post.call_args[1]["content"])
         assert request_data["tool_choice"] == "required"
 
         # Test specific tool choice
@@ -447,6 +471,6 @@ class TestToolIntegration:
             tool_choice={"type": "tool", "name": "test_tool"},
         )
 
-        request_data = mock_post.call_args[1]["json"]
+        request_data = json.loads(mock_post.call_args[1]["content"])
         assert request_data["tool_choice"]["type"] == "function"
         assert request_data["tool_choice"]["function"]["name"] == "test_tool"
@@ -1,9 +1,13 @@
+from unittest.mock import patch
+
 import pytest
 
+from anthropic_openai_bridge.transformers.request import logger as request_logger
 from anthropic_openai_bridge.transformers.request import \
     transform_anthropic_to_openai
 from anthropic_openai_bridge.transformers.response import \
     transform_openai_to_anthropic
+from anthropic_openai_bridge.utils import json_loads
 
 
 class TestRequestTransformer:
@@ -54,6 +58,22 @@ class TestRequestTransformer:
         assert openai_params["top_p"] == 0.9
         assert openai_params["stop"] == ["STOP"]
 
+    def test_params_not_formatted_when_debug_disabled(self):
+        class NoRepr:
+            def __repr__(self):
+                raise AssertionError("params were formatted for logging")
+
+        anthropic_params = {
+            "model": "claude-3-sonnet-20240229",
+            "messages": [{"role": "user", "content": "Hello, world!"}],
+            "temperature": NoRepr(),
+        }
+
+        with patch.object(request_logger, "isEnabledFor", return_value=False):
+            openai_params = transform_anthropic_to_openai(anthropic_params)
+
+        assert isinstance(openai_params["temperature"], NoRepr)
+
     def test_content_blocks(self):
         anthropic_params = {
             "model": "claude-3-sonnet-20240229",
@@ -147,3 +167,79 @@ class TestResponseTransformer:
 
             anthropic_response = transform_openai_to_anthropic(openai_response)
             assert anthropic_response.stop_reason == expected_anthropic_reason
+
+    def test_tool_call_arguments_parsing(self):
+        openai_response = {
+            "id": "test",
+            "choices": [
+                {
+                    "finish_reason": "tool_calls",
+                    "message": {
+                        "content": None,
+                        "tool_calls": [
+                            {
+                                "id": "call_1",
+                                "function": {
+                                    "name": "lookup",
+                                    "arguments": '{"query": "café"}',
+                                },
+                            },
+                            {
+                                "id": "call_2",
+                                "function": {"name": "ping", "arguments": None},
+                            },
+                            {
+                                "id": "call_3",
+                                "function": {"name": "broken", "arguments": "{"},
+                            },
+                        ],
+                    },
+                }
+            ],
+        }
+
+        anthropic_response = transform_openai_to_anthropic(openai_response)
+
+        assert [block.input for block in anthropic_response.content] == [
+            {"query": "café"},
+            {},
+            {},
+        ]
+
+    def test_message_id_generated_only_when_missing(self):
+        response = {"choices": [{"message": {"content": "hi"}}]}
+
+        with patch("anthropic_openai_bridge.transformers.response.uuid") as mock_uuid:
+            assert transform_openai_to_anthropic({"id": "abc", **response}).id == "abc"
+            mock_uuid.uuid4.assert_not_called()
+
+        for missing_id in ({}, {"id": None}):
+            generated = transform_openai_to_anthropic({**missing_id, **response}).id
+            assert generated.startswith("msg_")
+
+    def test_non_json_tool_arguments_skip_decoder(self):
+        openai_response = {
+            "id": "test",
+            "choices": [
+                {
+                    "message": {
+                        "tool_calls": [
+                            {"id": "a", "function": {"name": "f", "arguments": "oops"}},
+                            {
+                                "id": "b",
+                                "function": {"name": "g", "arguments": ' {"x": 1} '},
+                            },
+                        ]
+                    }
+                }
+            ],
+        }
+
+        with patch(
+            "anthropic_openai_bridge.transformers.response.json_loads",
+            wraps=json_loads,
+        ) as mock_loads:
+            anthropic_response = transform_openai_to_anthropic(openai_response)
+
+        assert [block.input for block in anthropic_response.content] == [{}, {"x": 1}]
+        mock_loads.assert_called_once_with('{"x": 1}')
@@ -81,6 +81,15 @@ class TestContentBlock:
         repr_str = repr(block)
         assert "ContentBlock(type='text', text='Hello')" == repr_str
 
+    def test_content_block_uses_slots(self):
+        """Test ContentBlock instances have no per-instance __dict__."""
+        block = ContentBlock(type="text", text="Hello")
+        assert not hasattr(block, "__dict__")
+        with pytest.raises(AttributeError):
+            block.extra = "value"
+        block.text += " world"
+        assert block.text == "Hello world"
+
 
 class TestMessage:
     """Test Message class."""
@@ -175,6 +184,13 @@ class TestToolUse:
         repr_str = repr(tool_use)
         assert "ToolUse(id='tool_123', name='get_weather'" in repr_str
 
+    def test_tool_use_uses_slots(self):
+        """Test ToolUse instances have no per-instance __dict__."""
+        tool_use = ToolUse(id="tool_123", name="get_weather", input={})
+        assert not hasattr(tool_use, "__dict__")
+        tool_use.input = {"city": "NYC"}
+        assert tool_use["input"] == {"city": "NYC"}
+
 
 class TestToolResult:
     """Test ToolResult class."""
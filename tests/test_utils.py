@@ -4,12 +4,24 @@ Tests for utils module.
 
 import json
 import logging
-import time
+import logging.handlers
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 
-from anthropic_openai_bridge.utils import log_request, log_response, measure_time, setup_logging
+from anthropic_openai_bridge.utils import (
+    RetryTransport,
+    debug_logging_enabled,
+    json_dumps,
+    json_loads,
+    log_request,
+    log_response,
+    measure_time,
+    sanitize_for_logging,
+    setup_logging,
+)
 
 
 class TestLogging:
@@ -24,7 +36,9 @@ class TestLogging:
             assert call_kwargs["level"] == logging.INFO
             assert call_kwargs["format"] == "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
             assert len(call_kwargs["handlers"]) == 1
-            assert isinstance(call_kwargs["handlers"][0], logging.StreamHandler)
+            assert isinstance(
+                call_kwargs["handlers"][0], logging.handlers.QueueHandler
+            )
 
     def test_setup_logging_custom_level(self):
         """Test setup_logging with custom level."""
@@ -35,7 +49,56 @@ class TestLogging:
             assert call_kwargs["level"] == logging.DEBUG
             assert call_kwargs["format"] == "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
             assert len(call_kwargs["handlers"]) == 1
-            assert isinstance(call_kwargs["handlers"][0], logging.StreamHandler)
+            assert isinstance(
+                call_kwargs["handlers"][0], logging.handlers.QueueHandler
+            )
+
+    def test_setup_logging_writes_from_listener(self, capsys):
+        """Test records reach stderr through the queue listener."""
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        root.handlers.clear()
+        try:
+            with patch("anthropic_openai_bridge.utils.atexit") as mock_atexit:
+                setup_logging()
+            stop_listener = mock_atexit.register.call_args.args[0]
+            logging.getLogger("bridge.test").info("queued %s", "message")
+            stop_listener()
+        finally:
+            root.handlers[:] = saved_handlers
+            root.setLevel(saved_level)
+
+        assert "bridge.test - INFO - queued message" in capsys.readouterr().err
+
+    def test_setup_logging_no_listener_when_already_configured(self):
+        """Test no listener thread is started when basicConfig is a no-op."""
+        with patch("anthropic_openai_bridge.utils.logging.basicConfig"), patch(
+            "anthropic_openai_bridge.utils.atexit"
+        ) as mock_atexit:
+            setup_logging()
+        mock_atexit.register.assert_not_called()
+
+
+class TestDebugLoggingEnabled:
+    """Test debug_logging_enabled function."""
+
+    def test_debug_logging_enabled_follows_logger_level(self):
+        """Test that the guard reflects the utils logger's DEBUG state."""
+        with patch("anthropic_openai_bridge.utils.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            assert debug_logging_enabled() is False
+
+            mock_logger.isEnabledFor.return_value = True
+            assert debug_logging_enabled() is True
+            mock_logger.isEnabledFor.assert_called_with(logging.DEBUG)
+
+
+def _debug_messages(mock_logger):
+    """Render the messages passed to a mocked logger.debug()."""
+    return [
+        call.args[0] % call.args[1:] if len(call.args) > 1 else call.args[0]
+        for call in mock_logger.debug.call_args_list
+    ]
 
 
 class TestLogRequest:
@@ -57,7 +120,7 @@ class TestLogRequest:
             
             log_request("GET", "https://example.com")
             
-            mock_logger.debug.assert_any_call("Request: GET https://example.com")
+            assert "Request: GET https://example.com" in _debug_messages(mock_logger)
 
     def test_log_request_with_headers(self):
         """Test log_request with headers."""
@@ -71,7 +134,7 @@ class TestLogRequest:
                 "Authorization": "***",  # Authorization header is masked
                 "Content-Type": "application/json"
             }
-            mock_logger.debug.assert_any_call(f"Headers: {expected_headers}")
+            assert f"Headers: {expected_headers}" in _debug_messages(mock_logger)
 
     def test_log_request_with_dict_data(self):
         """Test log_request with dictionary data."""
@@ -81,7 +144,17 @@ class TestLogRequest:
             
             log_request("POST", "https://example.com", None, data)
             
-            mock_logger.debug.assert_any_call(f"Data: {json.dumps(data, indent=2)}")
+            assert f"Data: {json.dumps(data, indent=2)}" in _debug_messages(mock_logger)
+
+    def test_log_request_with_non_string_keys(self):
+        """Test log_request with dictionary data keyed by ints."""
+        with patch("anthropic_openai_bridge.utils.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = True
+            data = {"logit_bias": {50256: -100}}
+            
+            log_request("POST", "https://example.com", None, data)
+            
+            assert f"Data: {json.dumps(data, indent=2)}" in _debug_messages(mock_logger)
 
     def test_log_request_with_string_data(self):
         """Test log_request with string data."""
@@ -91,7 +164,7 @@ class TestLogRequest:
             
             log_request("POST", "https://example.com", None, data)
             
-            mock_logger.debug.assert_any_call("Data: string data")
+            assert "Data: string data" in _debug_messages(mock_logger)
 
     def test_log_request_with_authorization_header_masking(self):
         """Test that Authorization headers are masked."""
@@ -101,12 +174,12 @@ class TestLogRequest:
             
             log_request("GET", "https://example.com", headers)
             
-            # Check that authorization header is masked but others aren't
+            # Check that both credential headers are masked
             expected_headers = {
-                "authorization": "***",  # Only authorization is masked by default
-                "x-api-key": "secret456"  # Other headers are not masked by the current implementation
+                "authorization": "***",
+                "x-api-key": "***",
             }
-            mock_logger.debug.assert_any_call(f"Headers: {expected_headers}")
+            assert f"Headers: {expected_headers}" in _debug_messages(mock_logger)
             
             # Verify sensitive data is not in the call arguments
             call_args = mock_logger.debug.call_args_list
@@ -114,6 +187,18 @@ class TestLogRequest:
             headers_str = str(headers_call)
             assert "token123" not in headers_str  # The actual token should be masked
 
+    def test_log_request_headers_masked_when_formatted(self):
+        """Test that headers are only masked once the record is rendered."""
+        with patch("anthropic_openai_bridge.utils.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = True
+            
+            log_request("GET", "https://example.com", {"Authorization": "Bearer secret"})
+            
+            headers_call = mock_logger.debug.call_args_list[1]
+            assert headers_call.args[0] == "Headers: %s"
+            assert not isinstance(headers_call.args[1], str)
+            assert str(headers_call.args[1]) == "{'Authorization': '***'}"
+
 
 class TestLogResponse:
     """Test log_response function."""
@@ -134,7 +219,7 @@ class TestLogResponse:
             
             log_response(200)
             
-            mock_logger.debug.assert_any_call("Response: 200")
+            assert "Response: 200" in _debug_messages(mock_logger)
 
     def test_log_response_with_duration(self):
         """Test log_response with duration."""
@@ -143,7 +228,7 @@ class TestLogResponse:
             
             log_response(200, duration=2.456)
             
-            mock_logger.debug.assert_any_call("Duration: 2.456s")
+            assert "Duration: 2.456s" in _debug_messages(mock_logger)
 
     def test_log_response_with_dict_data(self):
         """Test log_response with dictionary data."""
@@ -153,7 +238,7 @@ class TestLogResponse:
             
             log_response(200, data)
             
-            mock_logger.debug.assert_any_call(f"Response data: {json.dumps(data, indent=2)}")
+            assert f"Response data: {json.dumps(data, indent=2)}" in _debug_messages(mock_logger)
 
     def test_log_response_with_string_data(self):
         """Test log_response with string data."""
@@ -163,7 +248,7 @@ class TestLogResponse:
             
             log_response(200, data)
             
-            mock_logger.debug.assert_any_call("Response data: response string")
+            assert "Response data: response string" in _debug_messages(mock_logger)
 
     def test_log_response_complete(self):
         """Test log_response with all parameters."""
@@ -173,9 +258,24 @@ class TestLogResponse:
             
             log_response(200, data, 1.234)
             
-            mock_logger.debug.assert_any_call("Response: 200")
-            mock_logger.debug.assert_any_call("Duration: 1.234s")
-            mock_logger.debug.assert_any_call(f"Response data: {json.dumps(data, indent=2)}")
+            assert _debug_messages(mock_logger) == [
+                "Response: 200",
+                "Duration: 1.234s",
+                f"Response data: {json.dumps(data, indent=2)}",
+            ]
+
+    def test_log_response_data_serialised_when_formatted(self):
+        """Test that payloads are only pretty-printed once the record is rendered."""
+        with patch("anthropic_openai_bridge.utils.logger") as mock_logger, patch(
+            "anthropic_openai_bridge.utils._json_pretty", return_value="{}"
+        ) as mock_pretty:
+            mock_logger.isEnabledFor.return_value = True
+            
+            log_response(200, {"id": "msg_123"})
+            
+            mock_pretty.assert_not_called()
+            assert "Response data: {}" in _debug_messages(mock_logger)
+            mock_pretty.assert_called_once_with({"id": "msg_123"})
 
 
 class TestMeasureTime:
@@ -187,19 +287,178 @@ class TestMeasureTime:
         assert isinstance(result, float)
         assert result > 0
 
-    def test_measure_time_advances(self):
+    @patch("anthropic_openai_bridge.utils.time")
+    def test_measure_time_advances(self, mock_time):
         """Test that measure_time returns increasing values."""
+        mock_time.perf_counter.side_effect = [1.0, 1.01]
         time1 = measure_time()
-        time.sleep(0.01)  # Small delay
         time2 = measure_time()
         assert time2 > time1
 
     @patch("anthropic_openai_bridge.utils.time")
     def test_measure_time_calls_time_module(self, mock_time):
-        """Test that measure_time calls time.time()."""
-        mock_time.time.return_value = 1234567890.123
+        """Test that measure_time uses the monotonic performance counter."""
+        mock_time.perf_counter.return_value = 1234.567
         
         result = measure_time()
         
-        mock_time.time.assert_called_once()
-        assert result == 1234567890.123
\ No newline at end of file
+        mock_time.perf_counter.assert_called_once()
+        mock_time.time.assert_not_called()
+        assert result == 1234.567
+
+
+class TestJsonHelpers:
+    """Test JSON encode/decode helpers."""
+
+    def test_json_round_trip(self):
+        """Test that json_dumps output decodes back to the same object."""
+        data = {"model": "gpt-4", "messages": [{"role": "user", "content": "héllo"}]}
+        encoded = json_dumps(data)
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == data
+        assert json_loads(encoded) == data
+
+    def test_json_loads_accepts_str(self):
+        """Test json_loads with a str payload."""
+        assert json_loads('{"a": 1}') == {"a": 1}
+
+    def test_json_helpers_without_orjson(self):
+        """Test the stdlib fallback used when orjson is not installed."""
+        with patch("anthropic_openai_bridge.utils.orjson", None):
+            assert json_dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+            assert json_loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_json_loads_invalid_raises_decode_error(self):
+        """Test that invalid input raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("not json")
+
+
+class TestSanitizeForLogging:
+    """Test sanitize_for_logging function."""
+
+    def test_sanitize_masks_sensitive_keys(self):
+        """Test exact and substring matches are masked, case-insensitively."""
+        data = {
+            "Authorization": "Bearer abc",
+            "X-API-Key": "secret",
+            "openai_api_key": "sk-123",
+            "refresh_token": "tok",
+            "client_secret": "shh",
+            "Proxy-Authorization": "Basic abc",
+            "Cookie": "session=abc",
+            "model": "gpt-4",
+        }
+        assert sanitize_for_logging(data) == {
+            "Authorization": "***",
+            "X-API-Key": "***",
+            "openai_api_key": "***",
+            "refresh_token": "***",
+            "client_secret": "***",
+            "Proxy-Authorization": "***",
+            "Cookie": "***",
+            "model": "gpt-4",
+        }
+
+    def test_sanitize_nested_structures(self):
+        """Test masking inside nested dicts and lists without mutating input."""
+        data = {"messages": [{"role": "user", "password": "hunter2"}], "n": 1}
+        assert sanitize_for_logging(data) == {
+            "messages": [{"role": "user", "password": "***"}],
+            "n": 1,
+        }
+        assert data["messages"][0]["password"] == "hunter2"
+
+    def test_sanitize_repeated_keys(self):
+        """Test repeated key names are classified consistently."""
+        data = [{"token": "a", "type": "text"}, {"token": "b", "type": "text"}]
+        assert sanitize_for_logging(data) == [
+            {"token": "***", "type": "text"},
+            {"token": "***", "type": "text"},
+        ]
+
+
+class TestRetryTransport:
+    """Test status-code retries in RetryTransport."""
+
+    def _client(self, statuses, **kwargs):
+        responses = iter(statuses)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            status_code, headers = next(responses)
+            return httpx.Response(status_code, headers=headers)
+
+        transport = RetryTransport(httpx.MockTransport(handler), **kwargs)
+        return httpx.Client(transport=transport), calls
+
+    def test_retries_until_success(self):
+        """Test 429/5xx responses are retried until one succeeds."""
+        client, calls = self._client(
+            [(429, {}), (503, {}), (200, {})], max_retries=2, backoff_factor=0
+        )
+
+        response = client.post("https://api.example.com/chat", content=b"{}")
+
+        assert response.status_code == 200
+        assert len(calls) == 3
+        assert all(call.content == b"{}" for call in calls)
+
+    def test_returns_last_response_when_retries_exhausted(self):
+        """Test the final error response is returned once retries run out."""
+        client, calls = self._client(
+            [(503, {})] * 3, max_retries=2, backoff_factor=0
+        )
+
+        assert client.get("https://api.example.com").status_code == 503
+        assert len(calls) == 3
+
+    @pytest.mark.parametrize("status_code", [400, 500])
+    def test_non_retryable_statuses_not_retried(self, status_code):
+        """Test client errors and plain 500s are returned immediately."""
+        client, calls = self._client([(status_code, {})], max_retries=2)
+
+        assert client.get("https://api.example.com").status_code == status_code
+        assert len(calls) == 1
+
+    def test_backoff_honours_retry_after(self):
+        """Test exponential backoff and the Retry-After header."""
+        client, _ = self._client(
+            [(503, {}), (429, {"Retry-After": "3"}), (503, {}), (200, {})],
+            max_retries=3,
+            backoff_factor=0.5,
+        )
+
+        with patch("anthropic_openai_bridge.utils.time.sleep") as mock_sleep:
+            client.get("https://api.example.com")
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 3.0, 2.0]
+
+    @pytest.mark.parametrize(
+        "retry_after, expected",
+        [
+            ("1.5", 1.5),
+            ("Wed, 21 Oct 2015 07:28:10 GMT", 5.0),
+            ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+            ("3600", 60.0),
+            ("soon", 0.5),
+            ("nan", 0.5),
+        ],
+    )
+    def test_retry_after_formats(self, retry_after, expected):
+        """Test fractional, HTTP-date and unparseable Retry-After values."""
+        client, _ = self._client(
+            [(429, {"Retry-After": retry_after}), (200, {})],
+            max_retries=1,
+            backoff_factor=0.5,
+        )
+        now = datetime(2015, 10, 21, 7, 28, 5, tzinfo=timezone.utc)
+
+        with patch("anthropic_openai_bridge.utils.time.sleep") as mock_sleep, patch(
+            "anthropic_openai_bridge.utils.datetime", wraps=datetime
+        ) as mock_datetime:
+            mock_datetime.now.return_value = now
+            client.get("https://api.example.com")
+
+        mock_sleep.assert_called_once_with(expected)